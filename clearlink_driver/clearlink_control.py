@@ -5,7 +5,9 @@ Thread-safe control interface wrapping the EtherNet/IP communication layer.
 Provides higher-level motor control methods with error handling.
 """
 
+import array
 import threading
+import time
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 import logging
@@ -13,18 +15,23 @@ import logging
 from .clearlink_eip import ClearLinkEIP, ClearLinkStatus, AxisStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class ClearLinkDiagnostics:
     """Diagnostic data from ClearLink controller."""
     connected: bool = False
     connection_error: str = ""
-    axis_faults: List[bool] = None
+    axis_faults_mask: int = 0  # Bit (axis - 1) set when that axis is faulted
     total_commands_sent: int = 0
     total_errors: int = 0
 
-    def __post_init__(self):
-        if self.axis_faults is None:
-            self.axis_faults = [False] * 4
+    def fault(self, axis: int) -> bool:
+        """Check whether an axis (1-based) is faulted."""
+        return bool(self.axis_faults_mask >> (axis - 1) & 1)
+
+    @property
+    def any_fault(self) -> bool:
+        """True if any axis is faulted."""
+        return self.axis_faults_mask != 0
 
 
 class ClearLinkControl:
@@ -32,12 +39,14 @@ class ClearLinkControl:
     Thread-safe control layer for ClearLink motor controller.
 
     Provides higher-level motor control methods with:
-    - Thread-safe access via RLock
+    - Thread-safe command issue via a Lock (status reads are not serialized
+      here; the EIP layer serializes its own I/O)
     - Error handling and retry logic
     - Command tracking for diagnostics
     """
 
-    def __init__(self, ip_address: str, port: int = 44818, num_axes: int = 4):
+    def __init__(self, ip_address: str, port: int = 44818, num_axes: int = 4,
+                 status_ttl: float = 0.005, poll_period: float = 0.0):
         """
         Initialize ClearLink control.
 
@@ -45,26 +54,68 @@ class ClearLinkControl:
             ip_address: IP address of ClearLink controller
             port: EtherNet/IP port (default 44818)
             num_axes: Number of motor axes (1-4)
+            status_ttl: Seconds a status read is shared with other callers
+                        (0 to always read fresh)
+            poll_period: If > 0, poll status in a background thread at this
+                         period (seconds); read_status then serves the
+                         latest snapshot and status_ttl is unused
         """
-        self._eip = ClearLinkEIP(ip_address, port, num_axes)
+        self._eip = ClearLinkEIP(ip_address, port, num_axes, poll_period)
         self._num_axes = num_axes
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # Serializes drive_velocity's EIP sequences against each other and
+        # against stop()/shutdown()/clear_faults() without holding _lock
+        # across network round-trips. Taken before _lock, never while
+        # holding it.
+        self._cmd_in_flight = threading.Lock()
         self._logger = logging.getLogger(__name__)
 
         # Command tracking
-        self._last_velocities = [0] * num_axes
+        # Raw C ints rather than a list of boxed Python ints
+        self._last_velocities = array.array('i', [0] * num_axes)
+        # Immutable copy of the above for drive_velocity's unchanged check
+        self._last_velocities_tuple = (0,) * num_axes
+        # Command/error counts; status reads run outside _lock, so the
+        # counters have a lock of their own
+        self._counter_lock = threading.Lock()
         self._commands_sent = 0
         self._errors = 0
 
+        # Last status snapshot; concurrent pollers share one EIP read per TTL
+        self._status_ttl = status_ttl
+        self._status_lock = threading.Lock()
+        self._status = ClearLinkStatus()
+        self._status_time: Optional[float] = None
+
+        # Connection state mirrored from the EIP layer after each operation
+        # that can change it (see refresh_connection_state)
+        self._connected = False
+        self._connection_error = ""
+
     @property
     def connected(self) -> bool:
         """Check if connected to ClearLink."""
-        return self._eip.connected
+        return self._connected
 
     @property
     def connection_error(self) -> str:
         """Get last connection error message."""
-        return self._eip.connection_error
+        return self._connection_error
+
+    def refresh_connection_state(self):
+        """Re-sync the cached connection state from the EIP layer.
+
+        Called after every operation that talks to the controller, since
+        any failed read there can mark the connection lost.
+        """
+        self._connected = self._eip.connected
+        self._connection_error = self._eip.connection_error
+
+    def _count(self, commands: int = 0, errors: int = 0):
+        """Add to the command/error counters."""
+        with self._counter_lock:
+            self._commands_sent += commands
+            self._errors += errors
 
     def initialize(self) -> bool:
         """
@@ -75,22 +126,25 @@ class ClearLinkControl:
         """
         with self._lock:
             success = self._eip.connect()
+            self.refresh_connection_state()
             if success:
                 self._logger.info("ClearLink control initialized")
             return success
 
     def shutdown(self):
         """Shutdown ClearLink connection."""
-        with self._lock:
+        with self._cmd_in_flight, self._lock:
             # Stop all motors before disconnecting
             self._eip.stop_all()
             self._eip.disconnect()
+            self.refresh_connection_state()
             self._logger.info("ClearLink control shutdown")
 
     def reconnect(self) -> bool:
         """Reconnect to ClearLink (disconnect + connect)."""
         with self._lock:
             success = self._eip.reconnect()
+            self.refresh_connection_state()
             if success:
                 self._logger.info("ClearLink control reconnected")
             return success
@@ -107,13 +161,15 @@ class ClearLinkControl:
         """
         with self._lock:
             success = True
+            results = self._eip.set_motors_enable(axes, True)
+            self.refresh_connection_state()
             for axis in axes:
-                if not self._eip.set_motor_enable(axis, True):
-                    self._logger.error(f"Failed to enable axis {axis}")
-                    self._errors += 1
+                if not results[axis]:
+                    self._logger.error("Failed to enable axis %d", axis)
+                    self._count(errors=1)
                     success = False
                 else:
-                    self._commands_sent += 1
+                    self._count(commands=1)
             return success
 
     def disable_motors(self, axes: List[int]) -> bool:
@@ -128,13 +184,15 @@ class ClearLinkControl:
         """
         with self._lock:
             success = True
+            results = self._eip.set_motors_enable(axes, False)
+            self.refresh_connection_state()
             for axis in axes:
-                if not self._eip.set_motor_enable(axis, False):
-                    self._logger.error(f"Failed to disable axis {axis}")
-                    self._errors += 1
+                if not results[axis]:
+                    self._logger.error("Failed to disable axis %d", axis)
+                    self._count(errors=1)
                     success = False
                 else:
-                    self._commands_sent += 1
+                    self._count(commands=1)
             return success
 
     def drive_velocity(self, axis_velocities: List[int], accel: int = 10000) -> bool:
@@ -149,54 +207,75 @@ class ClearLinkControl:
         Returns:
             True if all velocity commands successful
         """
-        with self._lock:
-            success = True
-            print(f"[ClearLink] drive_velocity: incoming={axis_velocities}, last={self._last_velocities}", flush=True)
+        # Steady state: nothing changed and nothing to stop - no EIP traffic.
+        # Velocity 0 always goes through so a failed stop gets retried.
+        incoming = tuple(axis_velocities[:self._num_axes])
+        if incoming == self._last_velocities_tuple and 0 not in incoming:
+            return True
+
+        with self._cmd_in_flight:
+            # Snapshot state, then run the EIP round-trips without _lock held
+            with self._lock:
+                last = self._last_velocities[:]
+            debug = self._logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self._logger.debug("drive_velocity: incoming=%s, last=%s", axis_velocities, last)
 
-            for i, velocity in enumerate(axis_velocities):
-                axis = i + 1
-                if axis > self._num_axes:
-                    break
-
-                # Always process velocity=0 (stop) commands - don't skip even if unchanged
-                # This ensures motors stop even if previous stop failed
-                if velocity != 0 and velocity == self._last_velocities[i]:
-                    self._logger.debug(f"Axis {axis}: velocity unchanged at {velocity}, skipping")
+            success = True
+            committed = {}
+            cmd_delta = 0
+            err_delta = 0
+
+            # Work out which axes need a stop or a new velocity.
+            # Always process velocity=0 (stop) commands - don't skip even if unchanged
+            # This ensures motors stop even if previous stop failed
+            actions = [(i, i + 1, velocity)
+                       for i, (velocity, previous) in enumerate(zip(incoming, last))
+                       if velocity == 0 or velocity != previous]
+            if debug:
+                for i, axis, velocity in actions:
+                    self._logger.debug("Axis %d: velocity %d -> %d", axis, last[i], velocity)
+
+            # Hoist per-axis lookups out of the loop
+            eip = self._eip
+            log_error = self._logger.error
+
+            # Velocity parameters and triggers for every moving axis go
+            # out together in one request
+            moving = [(i, axis, velocity) for i, axis, velocity in actions if velocity != 0]
+            move_results = eip.set_velocities(
+                [(axis, velocity, accel) for _, axis, velocity in moving], trigger=True)
+            for i, axis, velocity in moving:
+                if not move_results[axis]:
+                    log_error("Failed to set velocity or trigger move for axis %d", axis)
+                    err_delta += 1
+                    success = False
                     continue
-
-                print(f"[ClearLink] Axis {axis}: velocity {self._last_velocities[i]} -> {velocity}", flush=True)
-
-                # Use stop_motor for velocity=0 (requires full handshake)
-                if velocity == 0:
-                    print(f"[ClearLink] Axis {axis}: calling stop_motor", flush=True)
-                    stop_ok = self._eip.stop_motor(axis)
-                    if not stop_ok:
-                        self._logger.error(f"Failed to stop axis {axis}")
-                        self._errors += 1
+                committed[i] = velocity
+                cmd_delta += 1
+
+            # Use stop_motors for velocity=0 (requires full handshake); every
+            # stopping axis shares each step's request
+            stopping = [(i, axis) for i, axis, velocity in actions if velocity == 0]
+            if stopping:
+                if debug:
+                    self._logger.debug("Axes %s: calling stop_motors", [axis for _, axis in stopping])
+                stop_results = eip.stop_motors([axis for _, axis in stopping])
+                for i, axis in stopping:
+                    if not stop_results[axis]:
+                        log_error("Failed to stop axis %d", axis)
+                        err_delta += 1
                         success = False
                         continue
-                    self._last_velocities[i] = 0
-                    self._commands_sent += 1
-                    continue
+                    committed[i] = 0
+                    cmd_delta += 1
 
-                # Set velocity
-                vel_ok = self._eip.set_velocity(axis, velocity, accel)
-                if not vel_ok:
-                    self._logger.error(f"Failed to set velocity for axis {axis}")
-                    self._errors += 1
-                    success = False
-                    continue
-
-                # Trigger the move
-                trig_ok = self._eip.trigger_move(axis)
-                if not trig_ok:
-                    self._logger.error(f"Failed to trigger move for axis {axis}")
-                    self._errors += 1
-                    success = False
-                    continue
-
-                self._last_velocities[i] = velocity
-                self._commands_sent += 1
+            with self._lock:
+                for i, velocity in committed.items():
+                    self._last_velocities[i] = velocity
+                self._last_velocities_tuple = tuple(self._last_velocities)
+            self._count(commands=cmd_delta, errors=err_delta)
+            self.refresh_connection_state()
 
             return success
 
@@ -210,13 +289,17 @@ class ClearLinkControl:
         Returns:
             True if stop command successful
         """
-        with self._lock:
+        # Waits out an in-flight drive_velocity, so its velocity cache
+        # commit cannot land after (and undo) the reset below
+        with self._cmd_in_flight, self._lock:
             success = self._eip.stop_all()
+            self.refresh_connection_state()
             if success:
-                self._last_velocities = [0] * self._num_axes
-                self._commands_sent += 1
+                self._last_velocities = array.array('i', [0] * self._num_axes)
+                self._last_velocities_tuple = (0,) * self._num_axes
+                self._count(commands=1)
             else:
-                self._errors += 1
+                self._count(errors=1)
             return success
 
     def clear_faults(self, axes: List[int]) -> Tuple[bool, str]:
@@ -229,21 +312,18 @@ class ClearLinkControl:
         Returns:
             Tuple of (success, message)
         """
-        with self._lock:
-            cleared = []
-            failed = []
-
-            for axis in axes:
-                if self._eip.clear_faults(axis):
-                    cleared.append(str(axis))
-                    self._commands_sent += 1
-                else:
-                    failed.append(str(axis))
-                    self._errors += 1
-
+        # The clear_faults service runs on its own executor thread; don't
+        # let a fault clear land in the middle of a drive_velocity sequence
+        with self._cmd_in_flight, self._lock:
+            results = self._eip.clear_faults_multi(axes)
+            self.refresh_connection_state()
+            failed = [axis for axis in axes if not results[axis]]
+            self._count(commands=len(axes) - len(failed), errors=len(failed))
+
+            # Only the reported list gets stringified
             if failed:
-                return False, f"Failed to clear faults on axes: {', '.join(failed)}"
-            return True, f"Cleared faults on axes: {', '.join(cleared)}"
+                return False, "Failed to clear faults on axes: " + ", ".join(map(str, failed))
+            return True, "Cleared faults on axes: " + ", ".join(map(str, axes))
 
     def home(self, axes: List[int], velocity: int, accel: int) -> Tuple[bool, str]:
         """
@@ -263,18 +343,37 @@ class ClearLinkControl:
         """
         with self._lock:
             # Placeholder - actual homing would be more complex
-            self._logger.info(f"Homing axes {axes} at velocity {velocity}")
+            self._logger.info("Homing axes %s at velocity %d", axes, velocity)
             return True, "Homing initiated (not fully implemented)"
 
     def read_status(self) -> ClearLinkStatus:
         """
         Read complete status from ClearLink.
 
+        Not serialized against commands: ClearLinkEIP guards its own I/O,
+        so a status poller never waits for a motion command to finish.
+        Reads within status_ttl of each other share one EIP transaction;
+        a caller arriving while a read is in flight waits for its result
+        rather than issuing another.
+
+        With a background poller (poll_period > 0), returns its latest
+        snapshot instead.
+
         Returns:
             ClearLinkStatus with current state of all axes
         """
-        with self._lock:
-            return self._eip.get_all_status()
+        snapshot = self._eip.latest_status()
+        if snapshot is not None:
+            self.refresh_connection_state()
+            return snapshot
+
+        with self._status_lock:
+            now = time.monotonic()
+            if self._status_time is None or now - self._status_time >= self._status_ttl:
+                self._status = self._eip.get_all_status_fresh()
+                self.refresh_connection_state()
+                self._status_time = now
+            return self._status
 
     def read_diagnostics(self) -> ClearLinkDiagnostics:
         """
@@ -283,14 +382,30 @@ class ClearLinkControl:
         Returns:
             ClearLinkDiagnostics with connection and error stats
         """
-        diag = ClearLinkDiagnostics()
-        diag.connected = self._eip.connected
-        diag.connection_error = self._eip.connection_error
-        diag.total_commands_sent = self._commands_sent
-        diag.total_errors = self._errors
-
-        # Get fault status for each axis
-        status = self.read_status()
-        diag.axis_faults = [status.axes[i].fault for i in range(self._num_axes)]
-
-        return diag
+        # Only the fault bits are needed, not the full status. The poller's
+        # snapshot or a status poll within the TTL already packed them;
+        # otherwise read just the shutdown registers. Sample the connection
+        # flags after the read so they reflect its outcome.
+        snapshot = self._eip.latest_status()
+        if snapshot is not None:
+            mask = snapshot.fault_mask
+        else:
+            with self._status_lock:
+                fresh = (self._status_time is not None
+                         and time.monotonic() - self._status_time < self._status_ttl)
+                mask = self._status.fault_mask if fresh else None
+        if mask is None:
+            mask = self._eip.get_fault_mask()
+        self.refresh_connection_state()
+
+        with self._counter_lock:
+            commands = self._commands_sent
+            errors = self._errors
+
+        return ClearLinkDiagnostics(
+            connected=self._connected,
+            connection_error=self._connection_error,
+            axis_faults_mask=mask,
+            total_commands_sent=commands,
+            total_errors=errors
+        )
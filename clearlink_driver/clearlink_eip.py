@@ -11,21 +11,207 @@ with different INSTANCES (not different classes):
 - Motor Output:  Class 0x66, Instance 1-4 for M0-M3
 """
 
+import struct
 import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from typing import Dict, Iterable, Optional, Tuple, List
 import logging
 import time
 
 try:
     from pycomm3 import CIPDriver
+    from pycomm3.cip_driver import with_forward_open
     PYCOMM3_AVAILABLE = True
 except ImportError:
     PYCOMM3_AVAILABLE = False
     logging.warning("pycomm3 not installed - ClearLink will run in stub mode")
 
 
-@dataclass
+# One embedded CIP request: (service, class, instance, attribute, request data)
+CIPRequest = Tuple[int, int, int, Optional[int], bytes]
+
+# Precompiled little-endian codecs for attribute data
+_DINT = struct.Struct('<i')
+_UDINT = struct.Struct('<I')
+_REAL = struct.Struct('<f')
+# One axis status read: status, shutdown, position, velocity (DINT) + torque (REAL)
+_AXIS_STATUS = struct.Struct('<4if')
+
+
+def encode_epath(class_id: int, instance: int, attribute: Optional[int] = None) -> bytes:
+    """Encode a padded logical EPATH (class/instance[/attribute])."""
+    path = bytearray()
+    for segment, value in ((0x20, class_id), (0x24, instance), (0x30, attribute)):
+        if value is None:
+            continue
+        if value <= 0xFF:
+            path += bytes((segment, value))
+        else:
+            # 16-bit logical segment: type | 0x01, pad byte, UINT value
+            path += bytes((segment | 0x01, 0x00)) + value.to_bytes(2, 'little')
+    return bytes(path)
+
+
+def _decode_dint(raw: Optional[bytes]) -> Optional[int]:
+    """Decode a DINT reply, or None if it is missing or short."""
+    return _DINT.unpack_from(raw)[0] if raw and len(raw) >= 4 else None
+
+
+def _encode_dint(value: int) -> bytes:
+    """Encode a DINT, accepting values with bit 31 set as their unsigned form."""
+    if -0x80000000 <= value < 0x80000000:
+        return _DINT.pack(value)
+    return _UDINT.pack(value & 0xFFFFFFFF)
+
+
+# Decoded STATUS_ATTRS of one axis (None where the read failed)
+StatusValues = Tuple[Optional[int], Optional[int], Optional[int], Optional[int],
+                     Optional[float]]
+
+
+def _exact_fields(replies: Iterable[Optional[bytes]]) -> bool:
+    """True if every reply is present and exactly one 4-byte field long.
+
+    Only then does joining them line each value up with its _AXIS_STATUS
+    field; a short reply next to a long one can add up to the right total
+    length and still shift every field after it.
+    """
+    return all(reply is not None and len(reply) == _DINT.size for reply in replies)
+
+
+def _decode_status_row(replies: List[Optional[bytes]]) -> StatusValues:
+    """Decode one axis's raw STATUS_ATTRS replies."""
+    if _exact_fields(replies):
+        # Common case: every read succeeded, decode all five in one call
+        return _AXIS_STATUS.unpack(b''.join(replies))
+    status_raw, shutdown_raw, pos_raw, vel_raw, torque_raw = replies
+    return (_decode_dint(status_raw), _decode_dint(shutdown_raw),
+            _decode_dint(pos_raw), _decode_dint(vel_raw),
+            _REAL.unpack_from(torque_raw)[0]
+            if torque_raw and len(torque_raw) >= 4 else None)
+
+
+def _decode_status_rows(rows: List[List[Optional[bytes]]]) -> List[StatusValues]:
+    """Decode the STATUS_ATTRS replies of several axes.
+
+    When every read came back exactly field-sized the whole batch is one
+    contiguous buffer and one iter_unpack pass; otherwise each axis is
+    decoded on its own.
+    """
+    replies = [reply for row in rows for reply in row]
+    if _exact_fields(replies):
+        joined = b''.join(replies)
+        if len(joined) == _AXIS_STATUS.size * len(rows):
+            return list(_AXIS_STATUS.iter_unpack(joined))
+    return [_decode_status_row(row) for row in rows]
+
+
+def _split_msp_reply(reply: bytes, count: int) -> Optional[List[Optional[bytes]]]:
+    """Split a Multiple Service Packet reply into its embedded replies.
+
+    Returns the data of each reply (None where its general status is an
+    error), or None if the reply is malformed: a service count other
+    than count, or an offset table or reply header that runs past the
+    end of the data.
+    """
+    size = len(reply)
+    table_end = 2 + 2 * count
+    if size < table_end or uint_array(1).unpack_from(reply)[0] != count:
+        return None
+    reply_offsets = uint_array(count).unpack_from(reply, 2) + (size,)
+    # Hand out zero-copy views into the one reply buffer rather than a
+    # new bytes object per embedded reply
+    view = memoryview(reply)
+    values: List[Optional[bytes]] = []
+    append = values.append
+    previous = table_end
+    for start, end in zip(reply_offsets, reply_offsets[1:]):
+        if start < previous or start + 4 > end or end > size:
+            return None
+        data_start = start + 4 + 2 * reply[start + 3]
+        if data_start > end:
+            return None
+        append(view[data_start:end] if reply[start + 2] == 0 else None)
+        previous = end
+    return values
+
+
+@lru_cache(maxsize=None)
+def _request_header(service: int, class_id: int, instance: int,
+                    attribute: Optional[int]) -> bytes:
+    """Service code, path size and EPATH of a Message Router request.
+
+    Every address this driver uses is fixed (a handful of services,
+    classes and attributes times num_axes instances), so each header is
+    built once and then served from the cache.
+    """
+    path = encode_epath(class_id, instance, attribute)
+    return bytes((service, len(path) // 2)) + path
+
+
+@lru_cache(maxsize=None)
+def uint_array(count: int) -> struct.Struct:
+    """Precompiled codec for count consecutive UINTs (an MSP offset table)."""
+    return struct.Struct(f'<{count}H')
+
+
+def _encode_request(request: CIPRequest) -> bytes:
+    """Encode one Message Router request for embedding in a Multiple Service Packet."""
+    service, class_id, instance, attribute, data = request
+    return _request_header(service, class_id, instance, attribute) + data
+
+
+class _RWLock:
+    """Writer-preferring reader-writer lock.
+
+    Any number of readers may hold it at once; a writer holds it alone.
+    Once a writer is waiting, new readers queue behind it so a steady
+    stream of status polls cannot starve a reconnect. Not reentrant.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read_locked(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_locked(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+# ClearLink motor connectors (M0-M3); status always reports this many axes
+MAX_AXES = 4
+
+
+@dataclass(slots=True, frozen=True)
 class AxisStatus:
     """Status data for a single axis."""
     enabled: bool = False
@@ -38,24 +224,26 @@ class AxisStatus:
     shutdown: int = 0  # Raw shutdown register
 
 
-@dataclass
+# AxisStatus is immutable, so every default/unknown axis can share one
+# instance instead of allocating its own
+_DEFAULT_AXIS = AxisStatus()
+_DEFAULT_AXES = (_DEFAULT_AXIS,) * MAX_AXES
+
+
+@dataclass(slots=True, frozen=True)
 class ClearLinkStatus:
-    """Complete status from ClearLink controller."""
+    """Complete status from ClearLink controller.
+
+    Immutable, so one snapshot can be handed to any number of readers.
+    """
     connected: bool = False
     connection_error: str = ""
-    axes: List[AxisStatus] = None
-    digital_inputs: List[bool] = None
-    digital_outputs: List[bool] = None
+    axes: Tuple[AxisStatus, ...] = _DEFAULT_AXES
+    digital_inputs: Tuple[bool, ...] = (False,) * 13
+    digital_outputs: Tuple[bool, ...] = (False,) * 13
     firmware_version: str = ""
     supply_voltage: float = 0.0
-
-    def __post_init__(self):
-        if self.axes is None:
-            self.axes = [AxisStatus() for _ in range(4)]
-        if self.digital_inputs is None:
-            self.digital_inputs = [False] * 13
-        if self.digital_outputs is None:
-            self.digital_outputs = [False] * 13
+    fault_mask: int = 0  # Bit (axis - 1) set when that axis is faulted
 
 
 class ClearLinkEIP:
@@ -98,6 +286,18 @@ class ClearLinkEIP:
     - Bit 17: Shutdowns Present
 
     IMPORTANT: To move, you must HOLD 0x11 (Enable + Load Velocity Move) high.
+
+    Multi-axis operations go out as Multiple Service Packets over the one
+    CIPDriver connection (see multi_service). They are not fanned out
+    across threads: pycomm3 keeps one request in flight per connection,
+    so per-axis worker threads would only queue on the lock. When the
+    device rejects 0x0A, the same requests are sent one at a time.
+
+    Status is polled over this explicit (class 3) connection rather than
+    a class 1 implicit I/O connection to the input assembly: pycomm3 has
+    no UDP producer/consumer support. To decouple status from the
+    caller's loop rate, use poll_period, which keeps a snapshot fresh
+    in a background thread the way a cyclic connection would.
     """
 
     # ClearLink EtherNet/IP Class IDs (Step & Direction)
@@ -136,23 +336,104 @@ class ClearLinkEIP:
     BIT_SHUTDOWNS_PRESENT = (1 << 17)
     BIT_LOAD_VEL_MOVE_ACK = (1 << 20)  # Load Velocity Move Acknowledge
 
-    def __init__(self, ip_address: str, port: int = 44818, num_axes: int = 4):
+    # Motor Input attributes making up one axis status read, in the order
+    # _parse_axis_status expects them
+    STATUS_ATTRS = (ATTR_IN_STATUS_REG, ATTR_IN_SHUTDOWN_REG, ATTR_IN_CMD_POSITION,
+                    ATTR_IN_CMD_VELOCITY, ATTR_IN_TORQUE)
+
+    # How long (seconds) the status path may reuse a slowly-changing Motor
+    # Input attribute. Anything not listed - including the status register
+    # and its ack bits - is read fresh on every poll. A write to an axis
+    # drops its cached values.
+    STATUS_ATTR_TTL = {ATTR_IN_SHUTDOWN_REG: 0.2, ATTR_IN_TORQUE: 0.5}
+
+    # Status register bits that mean an axis's other status attributes may
+    # be changing; an axis with none of them set is polled with a
+    # status-register-only probe (see _read_status_attrs)
+    STATUS_ACTIVE_MASK = BIT_STEPS_ACTIVE | BIT_SHUTDOWNS_PRESENT | BIT_MOTOR_FAULT
+    # A probed axis still gets a full read at least this often (seconds),
+    # so slowly drifting values such as holding torque stay current
+    IDLE_FULL_READ_S = 1.0
+
+    # Shutdown Register bits that are informational, not faults:
+    # TrackingError (0x01) + MotorDisabled (0x20) + bit 10 (0x400)
+    SHUTDOWN_NON_BLOCKING = 0x421
+
+    # CIP services / Message Router
+    SVC_MULTIPLE_SERVICE = 0x0A
+    SVC_GET_ATTR_SINGLE = 0x0E
+    SVC_SET_ATTR_SINGLE = 0x10
+    MESSAGE_ROUTER_CLASS = 0x02
+
+    # Ack polling schedule: re-read after these delays (the last one
+    # repeats) until the bit changes or the timeout expires
+    ACK_POLL_DELAYS = (0.002, 0.005, 0.01, 0.02, 0.05)
+
+    # Minimum time a clear/enable command is held before its result is
+    # polled, so the controller sees it even when nothing needs clearing
+    COMMAND_HOLD_S = 0.02
+
+    # Keep Multiple Service Packets within a standard (non-large) Forward
+    # Open connection size, leaving room for the Message Router header.
+    # Raised on connect when a Large Forward Open is negotiated.
+    MAX_MSP_SIZE = 480
+    MSP_HEADER_ROOM = 20
+
+    def __init__(self, ip_address: str, port: int = 44818, num_axes: int = 4,
+                 poll_period: float = 0.0):
+        """
+        Args:
+            ip_address: IP address of ClearLink controller
+            port: EtherNet/IP port (default 44818)
+            num_axes: Number of motor axes (1-4)
+            poll_period: If > 0, refresh status in a background thread at
+                         this period (seconds) and serve get_all_status from
+                         the latest snapshot
+        """
         self._ip_address = ip_address
         self._port = port
         self._num_axes = num_axes
+        # Valid axis numbers; `axis in self._axes` is an O(1) range check
+        self._axes = range(1, num_axes + 1)
         self._driver: Optional[CIPDriver] = None
-        self._lock = threading.RLock()
+        # Only connect/disconnect take this exclusively (they replace the
+        # driver). Status reads and motor commands share it, so a status
+        # poll is never stuck behind a command's ack wait.
+        self._lock = _RWLock()
+        # Motor commands run one at a time (see _command)
+        self._cmd_lock = threading.Lock()
+        # The CIPDriver socket carries one request at a time
+        self._io_lock = threading.Lock()
         self._connected = False
         self._connection_error = ""
         self._logger = logging.getLogger(__name__)
 
-        # Track current output register state for each axis
-        self._output_reg = [0] * num_axes
+        # Track current output register state for each axis (None = unknown,
+        # e.g. after connecting, so the next write always goes out)
+        self._output_reg: List[Optional[int]] = [None] * num_axes
         # Track which motors have been enabled (to avoid disruptive re-enable)
         self._motors_enabled = [False] * num_axes
-        # Track consecutive read failures to detect connection loss
+        # Track consecutive read failures to detect connection loss; guarded
+        # by _fail_lock since status reads run concurrently
+        self._fail_lock = threading.Lock()
         self._consecutive_read_failures = 0
         self._max_read_failures = 3
+        # Multiple Service Packet budget for the current connection
+        self._max_msp_size = self.MAX_MSP_SIZE
+        # (class, instance, attribute) -> (read time, raw reply) for the
+        # attributes in STATUS_ATTR_TTL
+        self._attr_cache: Dict[Tuple[int, int, int], Tuple[float, bytes]] = {}
+        # Per axis, (read time, STATUS_ATTRS replies) of its last full read
+        # if the axis was idle then (see _read_status_attrs)
+        self._last_status_raw: List[Optional[Tuple[float, List[Optional[bytes]]]]] = \
+            [None] * num_axes
+
+        # Background status poller (see poll_period)
+        self._poll_period = poll_period
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+        # Latest poller snapshot; replaced whole, never modified
+        self._latest: Optional[ClearLinkStatus] = None
 
     @property
     def connected(self) -> bool:
@@ -169,47 +450,76 @@ class ClearLinkEIP:
             self._logger.warning("pycomm3 not available, using stub mode")
             return False
 
-        with self._lock:
+        # connect() can run again without a disconnect(); retire the old
+        # poller first, as it may be waiting on the lock taken below
+        self._stop_poller()
+        with self._lock.write_locked():
             try:
                 self._driver = CIPDriver(self._ip_address)
                 self._driver.open()
-                self._connected = True
+                # Open the class 3 connection now rather than on the first
+                # request, so a refusal fails connect() instead of surfacing
+                # as read failures. pycomm3 tries a Large Forward Open and
+                # falls back to a standard one; every generic_message then
+                # goes over this connection (connected=True is its default).
+                with_forward_open(lambda driver: None)(self._driver)
+                self._max_msp_size = max(self.MAX_MSP_SIZE,
+                                         self._driver.connection_size - self.MSP_HEADER_ROOM)
+                with self._fail_lock:
+                    self._consecutive_read_failures = 0
+                    self._connected = True
                 self._connection_error = ""
-                self._consecutive_read_failures = 0
-                self._logger.info(f"Connected to ClearLink at {self._ip_address}")
+                self._attr_cache.clear()
+                self._last_status_raw = [None] * self._num_axes
+                # The controller may have kept its registers across our
+                # reconnect; don't trust anything we wrote before
+                self._output_reg = [None] * self._num_axes
+                self._logger.info(f"Connected to ClearLink at {self._ip_address} "
+                                  f"(connection size {self._driver.connection_size}, "
+                                  f"MSP budget {self._max_msp_size} bytes)")
 
                 # Initialize all axes with wide soft limits
                 self._init_axes()
 
+                if self._poll_period > 0:
+                    self._start_poller()
+
                 return True
             except Exception as e:
                 self._connected = False
                 self._connection_error = str(e)
                 self._logger.error(f"Failed to connect to ClearLink: {e}")
+                # Don't leave a half-open session (or connection) behind
+                if self._driver:
+                    try:
+                        self._driver.close()
+                    except Exception:
+                        pass
+                    self._driver = None
                 return False
 
     def _init_axes(self):
         """Initialize all axes with wide soft limits."""
-        for axis in range(1, self._num_axes + 1):
-            # Set very wide soft limits to prevent soft limit faults
-            self._write_attr(self.MOTOR_CONFIG_CLASS, axis,
-                           self.ATTR_CFG_NEG_SOFT_LIMIT, -2000000000)
-            self._write_attr(self.MOTOR_CONFIG_CLASS, axis,
-                           self.ATTR_CFG_POS_SOFT_LIMIT, 2000000000)
-
-            # Set default velocity parameters
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_VEL_LIMIT, 1000000)
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_ACCEL, 500000)
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_DECEL, 500000)
+        writes = []
+        for axis in self._axes:
+            writes += [
+                # Set very wide soft limits to prevent soft limit faults
+                (self.MOTOR_CONFIG_CLASS, axis, self.ATTR_CFG_NEG_SOFT_LIMIT, -2000000000),
+                (self.MOTOR_CONFIG_CLASS, axis, self.ATTR_CFG_POS_SOFT_LIMIT, 2000000000),
+                # Set default velocity parameters
+                (self.MOTOR_OUTPUT_CLASS, axis, self.ATTR_OUT_VEL_LIMIT, 1000000),
+                (self.MOTOR_OUTPUT_CLASS, axis, self.ATTR_OUT_ACCEL, 500000),
+                (self.MOTOR_OUTPUT_CLASS, axis, self.ATTR_OUT_DECEL, 500000),
+            ]
+        self._write_attrs_batch(writes)
 
         self._logger.info("Initialized axes with wide soft limits")
 
     def disconnect(self):
-        """Close EtherNet/IP connection."""
-        with self._lock:
+        """Close EtherNet/IP connection (Forward Close, then unregister session)."""
+        # Stop the poller first: it may be waiting on the lock taken below
+        self._stop_poller()
+        with self._lock.write_locked():
             if self._driver:
                 try:
                     self._driver.close()
@@ -220,125 +530,509 @@ class ClearLinkEIP:
                     self._connected = False
                     self._motors_enabled = [False] * self._num_axes
 
+    @contextmanager
+    def _command(self):
+        """Hold for the duration of a motor command.
+
+        Commands serialize against each other on _cmd_lock but only take
+        the shared side of _lock. Their ack waits therefore leave room for
+        status reads, which interleave between the command's round-trips
+        on _io_lock, while connect/disconnect still wait for them to finish.
+        """
+        with self._cmd_lock:
+            with self._lock.read_locked():
+                yield
+
+    def _start_poller(self):
+        """Start the background status poller, replacing any running one."""
+        self._stop_poller()
+        self._poll_stop = threading.Event()
+        self._poll_thread = threading.Thread(target=self._poll_loop, args=(self._poll_stop,),
+                                             name='clearlink-status-poller', daemon=True)
+        self._poll_thread.start()
+
+    def _stop_poller(self):
+        """Stop the background status poller, if running, and drop its snapshot."""
+        thread = self._poll_thread
+        if thread is None:
+            return
+        self._poll_stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self._poll_thread = None
+        self._latest = None
+
+    def _poll_loop(self, stop: threading.Event):
+        """Refresh the status snapshot every poll_period until stopped."""
+        while not stop.is_set():
+            try:
+                self._latest = self.get_all_status_fresh()
+            except Exception as e:
+                self._logger.error(f"Status poll error: {e}")
+            stop.wait(self._poll_period)
+
     def reconnect(self) -> bool:
         """Disconnect any stale driver, then attempt a fresh connection."""
         self.disconnect()
         return self.connect()
 
-    def _write_attr(self, class_id: int, instance: int, attribute: int,
-                    value: int) -> bool:
-        """Write a DINT attribute."""
+    def _write_raw(self, class_id: int, instance: int, attribute: int,
+                   data: bytes) -> bool:
+        """Write already-encoded attribute data (see _encode_dint, _UDINT)."""
         if not self._connected or not self._driver:
             return False
 
         try:
-            result = self._driver.generic_message(
-                service=0x10,  # Set Attribute Single
-                class_code=class_id,
-                instance=instance,
-                attribute=attribute,
-                request_data=value.to_bytes(4, 'little', signed=True if value < 0 else False)
-            )
-            return result is not None
+            with self._io_lock:
+                # Under _io_lock, so a status read already in flight cannot
+                # store its pre-write replies after the cache is dropped
+                self._invalidate_cache(instance)
+                result = self._driver.generic_message(
+                    service=self.SVC_SET_ATTR_SINGLE,
+                    class_code=class_id,
+                    instance=instance,
+                    attribute=attribute,
+                    request_data=data
+                )
+            # generic_message returns a Tag even when the device refuses
+            # the write; only its error says whether the value landed
+            return result is not None and not result.error
         except Exception as e:
             self._logger.error(f"Write attribute error: {e}")
             return False
 
     def _read_attr(self, class_id: int, instance: int, attribute: int) -> Optional[int]:
-        """Read a DINT attribute."""
+        """Read a DINT attribute.
+
+        Without a data_type, pycomm3 hands back the reply data as raw
+        bytes, so it is decoded exactly once, here.
+        """
         if not self._connected or not self._driver:
             return None
 
-        try:
-            result = self._driver.generic_message(
-                service=0x0E,  # Get Attribute Single
-                class_code=class_id,
-                instance=instance,
-                attribute=attribute
-            )
-            if result and result.value:
-                self._consecutive_read_failures = 0
-                return int.from_bytes(result.value, 'little', signed=True)
-            return None
-        except Exception as e:
+        with self._io_lock:
+            raw = self._send_single((self.SVC_GET_ATTR_SINGLE, class_id, instance,
+                                     attribute, b''))
+        return _decode_dint(raw)
+
+    def _record_read_failure(self, error: Exception):
+        """Count a failed read; mark disconnected after too many in a row.
+
+        The disconnect transition happens once, however many concurrent
+        readers fail past the limit.
+        """
+        with self._fail_lock:
             self._consecutive_read_failures += 1
-            self._logger.error(f"Read attribute error: {e}")
-            if self._consecutive_read_failures >= self._max_read_failures:
-                self._logger.error(f"Too many consecutive read failures ({self._consecutive_read_failures}), marking disconnected")
-                self._connected = False
-                self._connection_error = f"Read failures: {e}"
-            return None
+            failures = self._consecutive_read_failures
+            if failures < self._max_read_failures or not self._connected:
+                return
+            self._connected = False
+            self._connection_error = f"Read failures: {error}"
+        self._logger.error(f"Too many consecutive read failures ({failures}), marking disconnected")
+
+    def _record_read_success(self):
+        """Reset the consecutive failure count after a good read."""
+        # Unlocked check keeps the common no-failures case lock-free
+        if self._consecutive_read_failures:
+            with self._fail_lock:
+                self._consecutive_read_failures = 0
+
+    def multi_service(self, requests: List[CIPRequest]) -> List[Optional[bytes]]:
+        """Issue several CIP requests in as few round-trips as possible.
 
-    def _read_attr_float(self, class_id: int, instance: int, attribute: int) -> Optional[float]:
-        """Read a REAL (float32) attribute."""
-        import struct
+        Requests are packed into Multiple Service Packets (service 0x0A to
+        the Message Router), split so each packet fits the connection size
+        negotiated on connect (MAX_MSP_SIZE for a standard Forward Open).
+        If the device rejects a packet outright, its requests are retried
+        one at a time.
+
+        Args:
+            requests: (service, class, instance, attribute, data) tuples;
+                attribute may be None for instance-level services
+
+        Returns:
+            Per-request reply data (b'' for successful writes), or None
+            for requests that failed. Data from a batched reply is a
+            read-only memoryview into it, not a bytes copy.
+        """
+        # Held across every packet, so a split batch goes out back to back
+        with self._io_lock:
+            return self._multi_service_locked(requests)
+
+    def _multi_service_locked(self, requests: List[CIPRequest]) -> List[Optional[bytes]]:
+        """multi_service for a caller already holding _io_lock."""
         if not self._connected or not self._driver:
-            return None
+            return [None] * len(requests)
+
+        # Each written axis's cache is dropped once, not once per write
+        set_single = self.SVC_SET_ATTR_SINGLE
+        for instance in {request[2] for request in requests if request[0] == set_single}:
+            self._invalidate_cache(instance)
+
+        results: List[Optional[bytes]] = []
+        chunk: List[CIPRequest] = []
+        encoded: List[bytes] = []
+        size = 2
+        max_size = self._max_msp_size
+        send_multi = self._send_multi
+        for request in requests:
+            body = _encode_request(request)
+            if chunk and size + 2 + len(body) > max_size:
+                results.extend(send_multi(chunk, encoded))
+                chunk, encoded, size = [], [], 2
+            chunk.append(request)
+            encoded.append(body)
+            size += 2 + len(body)
+        if chunk:
+            results.extend(send_multi(chunk, encoded))
+        return results
+
+    def _send_multi(self, requests: List[CIPRequest],
+                    encoded: List[bytes]) -> List[Optional[bytes]]:
+        """Send one Multiple Service Packet and split its reply.
+
+        Caller holds _io_lock.
+        """
+        if len(requests) == 1:
+            return [self._send_single(requests[0])]
+
+        count = len(encoded)
+        # Service count followed by the offset of each embedded request
+        header = [count]
+        offset = 2 + 2 * count
+        for body in encoded:
+            header.append(offset)
+            offset += len(body)
+        packet = uint_array(count + 1).pack(*header) + b''.join(encoded)
+        # Like _send_single, only packets carrying a read feed the
+        # consecutive read failure count
+        has_read = any(request[0] == self.SVC_GET_ATTR_SINGLE for request in requests)
 
         try:
             result = self._driver.generic_message(
-                service=0x0E,  # Get Attribute Single
+                service=self.SVC_MULTIPLE_SERVICE,
+                class_code=self.MESSAGE_ROUTER_CLASS,
+                instance=1,
+                request_data=packet
+            )
+        except Exception as e:
+            self._logger.error(f"Multiple service request error: {e}")
+            if has_read:
+                self._record_read_failure(e)
+            return [None] * count
+
+        reply = result.value if result is not None else None
+        values = _split_msp_reply(reply, count) if reply else None
+        if values is None:
+            # Packet rejected as a whole (e.g. 0x0A unsupported), or a reply
+            # that doesn't parse - fall back to individual requests
+            error = result.error if result is not None else None
+            self._logger.debug(f"Multiple service request failed ({error}), sending singly")
+            return [self._send_single(request) for request in requests]
+
+        if has_read:
+            self._record_read_success()
+        return values
+
+    def _send_single(self, request: CIPRequest) -> Optional[bytes]:
+        """Send one request outside a Multiple Service Packet.
+
+        Only reads count toward the consecutive read failure limit;
+        writes stay out of it, as in _write_raw. Caller holds _io_lock.
+        """
+        service, class_id, instance, attribute, data = request
+        is_read = service == self.SVC_GET_ATTR_SINGLE
+        try:
+            result = self._driver.generic_message(
+                service=service,
                 class_code=class_id,
                 instance=instance,
-                attribute=attribute
+                attribute=attribute if attribute is not None else b'',
+                request_data=data
             )
-            if result and result.value and len(result.value) >= 4:
-                self._consecutive_read_failures = 0
-                return struct.unpack('<f', result.value[:4])[0]
-            return None
         except Exception as e:
-            self._consecutive_read_failures += 1
-            self._logger.error(f"Read float attribute error: {e}")
-            if self._consecutive_read_failures >= self._max_read_failures:
-                self._logger.error(f"Too many consecutive read failures ({self._consecutive_read_failures}), marking disconnected")
-                self._connected = False
-                self._connection_error = f"Read failures: {e}"
+            self._logger.error(f"CIP request error: {e}")
+            if is_read:
+                self._record_read_failure(e)
+            return None
+        if result is None or result.error:
             return None
+        if is_read:
+            self._record_read_success()
+        return result.value or b''
+
+    def _write_output_reg(self, axis: int, value: int, force: bool = False) -> bool:
+        """Write the output register for an axis.
 
-    def _write_output_reg(self, axis: int, value: int) -> bool:
-        """Write the output register for an axis."""
-        if axis < 1 or axis > self._num_axes:
+        Skipped (and reported successful) when the register already holds
+        value, unless force is set.
+        """
+        if axis not in self._axes:
             return False
-        success = self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                                  self.ATTR_OUT_OUTPUT_REG, value)
+        if not force and self._output_reg[axis - 1] == value:
+            return True
+        success = self._write_raw(self.MOTOR_OUTPUT_CLASS, axis,
+                                  self.ATTR_OUT_OUTPUT_REG, _UDINT.pack(value))
         if success:
             self._output_reg[axis - 1] = value
         return success
 
-    def _read_status_reg(self, axis: int) -> Optional[int]:
-        """Read the status register for an axis."""
-        if axis < 1 or axis > self._num_axes:
-            return None
-        return self._read_attr(self.MOTOR_INPUT_CLASS, axis, self.ATTR_IN_STATUS_REG)
+    def _write_output_regs(self, values: Dict[int, int],
+                           force: bool = False) -> Dict[int, bool]:
+        """Write the output registers of several axes in one round-trip.
 
-    def _read_shutdown_reg(self, axis: int) -> Optional[int]:
-        """Read the shutdown register for an axis."""
-        if axis < 1 or axis > self._num_axes:
-            return None
-        return self._read_attr(self.MOTOR_INPUT_CLASS, axis, self.ATTR_IN_SHUTDOWN_REG)
+        Axes whose register already holds the value are skipped unless
+        force is set.
+        """
+        results = {}
+        axes = []
+        for axis, value in values.items():
+            if not force and self._output_reg[axis - 1] == value:
+                results[axis] = True
+            else:
+                axes.append(axis)
+        replies = self.multi_service([
+            (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+             self.ATTR_OUT_OUTPUT_REG, _UDINT.pack(values[axis]))
+            for axis in axes
+        ])
+        for axis, reply in zip(axes, replies):
+            results[axis] = reply is not None
+            if reply is not None:
+                self._output_reg[axis - 1] = values[axis]
+        return results
+
+    def _read_attr_multi(self, class_id: int, attribute: int,
+                         axes: Iterable[int]) -> Dict[int, Optional[int]]:
+        """Read the same DINT attribute from several axes in one round-trip."""
+        axes = list(axes)
+        replies = self.multi_service([
+            (self.SVC_GET_ATTR_SINGLE, class_id, axis, attribute, b'')
+            for axis in axes
+        ])
+        return {axis: _decode_dint(reply)
+                for axis, reply in zip(axes, replies)}
+
+    def _write_attrs_batch(self, writes: List[Tuple[int, int, int, int]]) -> List[bool]:
+        """Write several DINT attributes in as few round-trips as possible.
+
+        Args:
+            writes: (class, instance, attribute, value) tuples
+
+        Returns:
+            Success per write, in order
+        """
+        replies = self.multi_service([
+            (self.SVC_SET_ATTR_SINGLE, class_id, instance, attribute, _encode_dint(value))
+            for class_id, instance, attribute, value in writes
+        ])
+        return [reply is not None for reply in replies]
+
+    def _read_status_attrs(self, axes: Iterable[int]) -> List[List[Optional[bytes]]]:
+        """Read STATUS_ATTRS for several axes in as few round-trips as possible.
+
+        Attributes still within their STATUS_ATTR_TTL are served from the
+        cache and left out of the request. An axis whose last full read
+        showed none of STATUS_ACTIVE_MASK (not moving, no shutdowns or
+        fault) only has its status register read; if that is unchanged,
+        its previous replies are reused, otherwise the rest is fetched in
+        a second request. All probes share the first request with the
+        full reads of active axes.
+
+        The whole read holds _io_lock once, so no command write can land
+        between the probe and its follow-up request.
+
+        Returns:
+            Per axis, the raw reply per attribute (None for failed reads)
+        """
+        with self._io_lock:
+            return self._read_status_attrs_locked(axes)
+
+    def _read_status_attrs_locked(self, axes: Iterable[int]) -> List[List[Optional[bytes]]]:
+        """_read_status_attrs for a caller already holding _io_lock."""
+        now = time.monotonic()
+        last = self._last_status_raw
+        rows: Dict[int, List[Optional[bytes]]] = {}
+        pending = []
+        requests = []
+        probes = []
+        for axis in axes:
+            entry = last[axis - 1]
+            if entry is not None and now - entry[0] < self.IDLE_FULL_READ_S:
+                probes.append((axis, entry[1], len(requests)))
+                requests.append((self.SVC_GET_ATTR_SINGLE, self.MOTOR_INPUT_CLASS, axis,
+                                 self.ATTR_IN_STATUS_REG, b''))
+            else:
+                rows[axis] = self._queue_status_reads(axis, now, pending, requests)
+        replies = self._multi_service_locked(requests)
+        self._fill_status_reads(pending, replies, now)
+
+        # Idle axes whose status register changed need the full read after all
+        changed = []
+        for axis, previous, index in probes:
+            if replies[index] is not None and replies[index] == previous[0]:
+                rows[axis] = previous
+            else:
+                changed.append(axis)
+        if changed:
+            pending = []
+            requests = []
+            for axis in changed:
+                rows[axis] = self._queue_status_reads(axis, now, pending, requests)
+            self._fill_status_reads(pending, self._multi_service_locked(requests), now)
+
+        # Remember complete full reads of idle axes for the next probe
+        for axis, row in rows.items():
+            entry = last[axis - 1]
+            if entry is not None and entry[1] is row:
+                continue  # reused, keep the original read time
+            status_reg = _decode_dint(row[0])
+            idle = (status_reg is not None and not status_reg & self.STATUS_ACTIVE_MASK
+                    and None not in row)
+            last[axis - 1] = (now, row) if idle else None
+        return [rows[axis] for axis in axes]
+
+    def _queue_status_reads(self, axis: int, now: float, pending: list,
+                            requests: List[CIPRequest]) -> List[Optional[bytes]]:
+        """Queue the STATUS_ATTRS reads for one axis that the cache can't serve.
+
+        Returns the axis's reply row, with cached replies filled in and
+        None placeholders for what _fill_status_reads will fill.
+        """
+        cache = self._attr_cache
+        ttls = self.STATUS_ATTR_TTL
+        class_id = self.MOTOR_INPUT_CLASS
+        row: List[Optional[bytes]] = []
+        for attribute in self.STATUS_ATTRS:
+            key = (class_id, axis, attribute)
+            cached = cache.get(key)
+            if cached is not None and now - cached[0] < ttls[attribute]:
+                row.append(cached[1])
+                continue
+            pending.append((row, len(row), key, len(requests)))
+            requests.append((self.SVC_GET_ATTR_SINGLE, class_id, axis, attribute, b''))
+            row.append(None)
+        return row
+
+    def _fill_status_reads(self, pending: list, replies: List[Optional[bytes]], now: float):
+        """Store replies to queued status reads in their rows and the cache."""
+        cache = self._attr_cache
+        ttls = self.STATUS_ATTR_TTL
+        for row, index, key, request_index in pending:
+            reply = replies[request_index]
+            row[index] = reply
+            if reply and key[2] in ttls:
+                cache[key] = (now, reply)
+
+    def _invalidate_cache(self, instance: int):
+        """Drop cached attributes of an axis after a write that may change its state."""
+        cache = self._attr_cache
+        for key in list(cache):
+            if key[1] == instance:
+                cache.pop(key, None)
+        if instance in self._axes:
+            self._last_status_raw[instance - 1] = None
+
+    def _valid_axes(self, axes: Iterable[int]) -> List[int]:
+        """Filter out axis numbers outside 1..num_axes."""
+        return [axis for axis in axes if axis in self._axes]
+
+    def _wait_bit(self, class_id: int, instance: int, attribute: int,
+                  mask: int, want_set: bool, timeout_s: float) -> Optional[float]:
+        """Poll an attribute until (value & mask) matches want_set.
+
+        Checks immediately, then backs off along ACK_POLL_DELAYS so a fast
+        ack is seen within a couple of milliseconds without hammering the
+        controller on a slow one.
+
+        Returns:
+            Seconds waited if the bit reached the wanted state, None on timeout
+        """
+        start = time.monotonic()
+        deadline = start + timeout_s
+        delays = self.ACK_POLL_DELAYS
+        n = 0
+        while True:
+            value = self._read_attr(class_id, instance, attribute)
+            if value is not None and bool(value & mask) == want_set:
+                return time.monotonic() - start
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(delays[min(n, len(delays) - 1)], remaining))
+            n += 1
+
+    def _wait_bits(self, attribute: int, axes: List[int], mask: int, want_set: bool,
+                   timeout_s: float) -> Dict[int, Optional[int]]:
+        """Poll a Motor Input attribute on several axes until every
+        (value & mask) matches want_set.
+
+        All axes are read in one request per poll, on the same backoff
+        schedule as _wait_bit.
+
+        Returns:
+            Last value read per axis (None if unreadable)
+        """
+        deadline = time.monotonic() + timeout_s
+        delays = self.ACK_POLL_DELAYS
+        n = 0
+        while True:
+            values = self._read_attr_multi(self.MOTOR_INPUT_CLASS, attribute, axes)
+            if all(value is not None and bool(value & mask) == want_set
+                   for value in values.values()):
+                return values
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return values
+            time.sleep(min(delays[min(n, len(delays) - 1)], remaining))
+            n += 1
+
+    def _wait_shutdown_clear(self, axes: List[int], mask: int,
+                             timeout_s: float) -> Dict[int, Optional[int]]:
+        """Poll the shutdown registers of several axes until no bit in mask is set.
+
+        Returns:
+            Last shutdown register read per axis (None if unreadable)
+        """
+        return self._wait_bits(self.ATTR_IN_SHUTDOWN_REG, axes, mask, False, timeout_s)
 
     # Motor Control Methods
 
     def clear_faults(self, axis: int) -> bool:
         """Clear faults on an axis."""
-        if axis < 1 or axis > self._num_axes:
-            return False
+        return self.clear_faults_multi([axis]).get(axis, False)
 
-        with self._lock:
-            # Write Clear Alerts + Clear Motor Fault
-            self._write_output_reg(axis, self.BIT_CLEAR_ALERTS | self.BIT_CLEAR_MOTOR_FAULT)
-            time.sleep(0.3)
+    def clear_faults_multi(self, axes: List[int]) -> Dict[int, bool]:
+        """Clear faults on several axes, sharing round-trips and settle delays.
+
+        Returns:
+            Dict mapping each requested axis to its success
+        """
+        results = {axis: False for axis in axes}
+        valid = self._valid_axes(axes)
+        if not valid:
+            return results
+
+        with self._command():
+            # Write Clear Alerts + Clear Motor Fault, held until the blocking
+            # shutdowns drop (max 400ms)
+            self._write_output_regs({axis: self.BIT_CLEAR_ALERTS | self.BIT_CLEAR_MOTOR_FAULT
+                                     for axis in valid})
+            time.sleep(self.COMMAND_HOLD_S)
+            self._wait_shutdown_clear(valid, ~self.SHUTDOWN_NON_BLOCKING, 0.4)
             # Clear the command
-            self._write_output_reg(axis, 0)
-            time.sleep(0.1)
+            self._write_output_regs({axis: 0 for axis in valid})
 
-            # Check if shutdown cleared
-            shutdown = self._read_shutdown_reg(axis)
-            if shutdown and shutdown != 0:
-                self._logger.warning(f"Axis {axis} shutdown not fully cleared: 0x{shutdown:08X}")
-                return False
+            # Check if shutdown cleared (max 100ms)
+            shutdowns = self._wait_shutdown_clear(valid, ~0, 0.1)
+            for axis in valid:
+                shutdown = shutdowns[axis]
+                if shutdown and shutdown != 0:
+                    self._logger.warning(f"Axis {axis} shutdown not fully cleared: 0x{shutdown:08X}")
+                    continue
+                results[axis] = True
 
-            return True
+            return results
 
     def set_motor_enable(self, axis: int, enable: bool) -> bool:
         """Enable or disable a motor axis.
@@ -350,78 +1044,135 @@ class ClearLinkEIP:
         IMPORTANT: If motor is already enabled, we skip the fault-clear sequence
         to avoid disrupting an active motor (writing 0x00 would disable it).
         """
-        if axis < 1 or axis > self._num_axes:
-            return False
+        return self.set_motors_enable([axis], enable).get(axis, False)
 
-        with self._lock:
-            if enable:
-                # Check if already enabled - skip disruptive sequence
-                if self._motors_enabled[axis - 1]:
-                    # Motor already enabled, just ensure output reg has enable bit
-                    # Don't write 0x01 if we're in the middle of moving (0x11)
-                    if self._output_reg[axis - 1] & self.BIT_ENABLE:
-                        return True
-                    # Re-enable if somehow lost
-                    self._write_output_reg(axis, self.BIT_ENABLE)
-                    return True
-
-                # First-time enable: clear faults and enable
-                self._write_output_reg(axis, self.BIT_CLEAR_ALERTS | self.BIT_CLEAR_MOTOR_FAULT)
-                time.sleep(0.3)
-                self._write_output_reg(axis, 0)
-                time.sleep(0.1)
-
-                # Enable the motor
-                self._write_output_reg(axis, self.BIT_ENABLE)
-                time.sleep(0.2)
-
-                # Check shutdown register - should be clear or only have non-blocking faults
-                shutdown = self._read_shutdown_reg(axis)
+    def set_motors_enable(self, axes: List[int], enable: bool) -> Dict[int, bool]:
+        """Enable or disable several axes, sharing round-trips and settle delays.
+
+        Same semantics as set_motor_enable, applied to every axis at once.
+
+        Returns:
+            Dict mapping each requested axis to its success
+        """
+        results = {axis: False for axis in axes}
+        valid = self._valid_axes(axes)
+        if not valid:
+            return results
+
+        with self._command():
+            if not enable:
+                # Disable
+                self._write_output_regs({axis: 0 for axis in valid})
+                for axis in valid:
+                    self._motors_enabled[axis - 1] = False
+                    results[axis] = True
+                return results
+
+            # Check if already enabled - skip disruptive sequence
+            # Motor already enabled, just ensure output reg has enable bit
+            # Don't write 0x01 if we're in the middle of moving (0x11)
+            fresh = [axis for axis in valid if not self._motors_enabled[axis - 1]]
+            lost = [axis for axis in valid if self._motors_enabled[axis - 1]
+                    and not (self._output_reg[axis - 1] or 0) & self.BIT_ENABLE]
+            for axis in valid:
+                if axis not in fresh:
+                    results[axis] = True
+
+            if not fresh:
+                # Re-enable if somehow lost
+                if lost:
+                    self._write_output_regs({axis: self.BIT_ENABLE for axis in lost})
+                return results
+
+            # First-time enable: clear faults and enable
+            self._write_output_regs({axis: self.BIT_CLEAR_ALERTS | self.BIT_CLEAR_MOTOR_FAULT
+                                     for axis in fresh})
+            time.sleep(self.COMMAND_HOLD_S)
+            self._wait_shutdown_clear(fresh, ~self.SHUTDOWN_NON_BLOCKING, 0.3)
+            self._write_output_regs({axis: 0 for axis in fresh})
+            time.sleep(self.COMMAND_HOLD_S)
+
+            # Enable the motors (plus any already-enabled axis that lost its bit)
+            self._write_output_regs({axis: self.BIT_ENABLE for axis in fresh + lost})
+            time.sleep(self.COMMAND_HOLD_S)
+
+            # Check shutdown register - should be clear or only have non-blocking
+            # faults. Wait (max 200ms) for MotorDisabled/MotorFaulted to drop.
+            shutdowns = self._wait_shutdown_clear(fresh, 0x420, 0.2)
+            for axis in fresh:
+                shutdown = shutdowns[axis]
                 # Bit 5 (0x20) = MotorDisabled - this is OK, just means we haven't started moving yet
                 # Bit 10 (0x400) = MotorFaulted - this would block operation
                 blocking_faults = shutdown & 0x400 if shutdown else 0
 
                 if blocking_faults:
                     self._logger.warning(f"Axis {axis} has blocking faults: 0x{shutdown:08X}")
-                    return False
+                    continue
 
                 shutdown_hex = f"0x{shutdown:08X}" if shutdown else "0x00"
                 self._logger.info(f"Axis {axis} enabled (shutdown={shutdown_hex})")
                 self._motors_enabled[axis - 1] = True
-                return True
-            else:
-                # Disable
-                self._write_output_reg(axis, 0)
-                self._motors_enabled[axis - 1] = False
-                return True
+                results[axis] = True
+
+            return results
 
     def set_velocity(self, axis: int, steps_per_sec: int, accel: int = 500000) -> bool:
         """Set velocity for continuous motion."""
-        if axis < 1 or axis > self._num_axes:
-            return False
-
-        with self._lock:
-            self._logger.info(f"[set_velocity] Axis {axis}: vel={steps_per_sec}, accel={accel}")
+        return self.set_velocities([(axis, steps_per_sec, accel)]).get(axis, False)
 
-            # Set velocity limit
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_VEL_LIMIT, abs(steps_per_sec) + 100000)
+    def set_velocities(self, commands: List[Tuple[int, int, int]],
+                       trigger: bool = False) -> Dict[int, bool]:
+        """Set velocity for several axes in one round-trip.
 
-            # Set acceleration/deceleration
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_ACCEL, accel)
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_DECEL, accel)
+        Args:
+            commands: (axis, steps_per_sec, accel) tuples
+            trigger: Also trigger each axis's move, as trigger_moves does,
+                     in the same request right after its velocity writes
 
-            # Set jog velocity (signed for direction)
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_JOG_VEL, steps_per_sec)
+        Returns:
+            Dict mapping each commanded axis to its success
+        """
+        results = {axis: False for axis, _, _ in commands}
+        valid = [cmd for cmd in commands if cmd[0] in self._axes]
+        if not valid:
+            return results
 
-            # Read back to verify
-            jog_vel = self._read_attr(self.MOTOR_OUTPUT_CLASS, axis, self.ATTR_OUT_JOG_VEL)
-            self._logger.info(f"[set_velocity] Axis {axis}: jog_vel readback = {jog_vel}")
+        requests = []
+        for axis, steps_per_sec, accel in valid:
+            self._logger.info(f"[set_velocity] Axis {axis}: vel={steps_per_sec}, accel={accel}")
+            requests += [
+                # Set velocity limit
+                (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                 self.ATTR_OUT_VEL_LIMIT, _encode_dint(abs(steps_per_sec) + 100000)),
+                # Set acceleration/deceleration
+                (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                 self.ATTR_OUT_ACCEL, _encode_dint(accel)),
+                (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                 self.ATTR_OUT_DECEL, _encode_dint(accel)),
+                # Set jog velocity (signed for direction)
+                (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                 self.ATTR_OUT_JOG_VEL, _encode_dint(steps_per_sec)),
+                # Read back to verify
+                (self.SVC_GET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                 self.ATTR_OUT_JOG_VEL, b''),
+            ]
+            if trigger:
+                requests += self._trigger_requests(axis)
+        stride = 8 if trigger else 5
+
+        with self._command():
+            replies = self.multi_service(requests)
+
+            for n, (axis, _, _) in enumerate(valid):
+                readback = replies[n * stride + 4]
+                jog_vel = _decode_dint(readback)
+                self._logger.info(f"[set_velocity] Axis {axis}: jog_vel readback = {jog_vel}")
+                if trigger:
+                    results[axis] = self._finish_trigger(axis, replies[n * stride + 5:n * stride + 8])
+                else:
+                    results[axis] = True
 
-            return True
+        return results
 
     def trigger_move(self, axis: int) -> bool:
         """Start or continue velocity movement.
@@ -430,51 +1181,113 @@ class ClearLinkEIP:
         Load Vel Move Ack is cleared. Otherwise ClearLink ignores new commands.
         Also clears any shutdown faults that would block motion.
         """
-        if axis < 1 or axis > self._num_axes:
-            return False
+        return self.trigger_moves([axis]).get(axis, False)
 
-        with self._lock:
-            # Check for shutdown faults that would block motion
-            shutdown_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                          self.ATTR_IN_SHUTDOWN_REG)
-            # Non-blocking bits (0x421): MotorDisabled(0x20) + MotorFaulted(0x400) + TrackingError(0x01)
-            # But 0x001 (Command While Shutdown) IS blocking, so we check for any faults
-            if shutdown_reg is not None and shutdown_reg != 0:
-                shutdown_hex = f"0x{shutdown_reg:04x}" if shutdown_reg is not None else "None"
-                self._logger.info(f"[trigger_move] Axis {axis}: shutdown={shutdown_hex}, clearing faults")
-                # Clear faults: 0xC0 = Clear Alerts (0x40) + Clear Motor Fault (0x80)
-                self._write_output_reg(axis, self.BIT_CLEAR_ALERTS | self.BIT_CLEAR_MOTOR_FAULT)
-                time.sleep(0.1)
-                self._write_output_reg(axis, 0x00)
-                time.sleep(0.05)
-                # Re-enable
-                self._write_output_reg(axis, self.BIT_ENABLE)
-                time.sleep(0.05)
-
-            # Check if there's a pending ack from previous move
+    def trigger_moves(self, axes: List[int]) -> Dict[int, bool]:
+        """Start or continue velocity movement on several axes.
+
+        Same semantics as trigger_move. The fast path for every axis
+        shares one request; only axes it could not trigger cleanly go
+        through the recovery sequence, one at a time.
+
+        Returns:
+            Dict mapping each requested axis to its success
+        """
+        results = {axis: False for axis in axes}
+        valid = self._valid_axes(axes)
+        if not valid:
+            return results
+
+        with self._command():
+            requests = []
+            for axis in valid:
+                requests += self._trigger_requests(axis)
+            replies = self.multi_service(requests)
+            for n, axis in enumerate(valid):
+                results[axis] = self._finish_trigger(axis, replies[n * 3:n * 3 + 3])
+            return results
+
+    def _trigger_requests(self, axis: int) -> List[CIPRequest]:
+        """trigger_move's fast path: read the shutdown and status registers
+        and write Enable + Load Velocity Move.
+
+        The reads are processed first, so they show the state the trigger
+        landed in.
+        """
+        return [
+            (self.SVC_GET_ATTR_SINGLE, self.MOTOR_INPUT_CLASS, axis,
+             self.ATTR_IN_SHUTDOWN_REG, b''),
+            (self.SVC_GET_ATTR_SINGLE, self.MOTOR_INPUT_CLASS, axis,
+             self.ATTR_IN_STATUS_REG, b''),
+            (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+             self.ATTR_OUT_OUTPUT_REG, _UDINT.pack(self.BIT_ENABLE | self.BIT_LOAD_VEL_MOVE)),
+        ]
+
+    def _finish_trigger(self, axis: int, replies: List[Optional[bytes]]) -> bool:
+        """Check the replies to _trigger_requests, recovering if needed.
+
+        Caller holds _command().
+        """
+        shutdown_raw, status_raw, trigger_reply = replies
+        if trigger_reply is not None:
+            self._output_reg[axis - 1] = self.BIT_ENABLE | self.BIT_LOAD_VEL_MOVE
+        shutdown_reg = _decode_dint(shutdown_raw)
+        status_reg = _decode_dint(status_raw)
+        if (trigger_reply is not None and shutdown_reg == 0 and status_reg is not None
+                and not status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
+            return True
+        return self._retrigger_move(axis, shutdown_reg, status_reg)
+
+    def _retrigger_move(self, axis: int, shutdown_reg: Optional[int],
+                        status_reg: Optional[int]) -> bool:
+        """trigger_move's recovery, given the registers the fast path read.
+
+        Caller holds _command().
+        """
+        trigger = self.BIT_ENABLE | self.BIT_LOAD_VEL_MOVE
+        # Slow path: the trigger may have been ignored, so fix up
+        # whatever blocked it and trigger again.
+
+        # Check for shutdown faults that would block motion
+        # Non-blocking bits (0x421): MotorDisabled(0x20) + MotorFaulted(0x400) + TrackingError(0x01)
+        # But 0x001 (Command While Shutdown) IS blocking, so we check for any faults
+        if shutdown_reg is not None and shutdown_reg != 0:
+            shutdown_hex = f"0x{shutdown_reg:04x}" if shutdown_reg is not None else "None"
+            self._logger.info(f"[trigger_move] Axis {axis}: shutdown={shutdown_hex}, clearing faults")
+            # Clear faults: 0xC0 = Clear Alerts (0x40) + Clear Motor Fault (0x80)
+            self._write_output_reg(axis, self.BIT_CLEAR_ALERTS | self.BIT_CLEAR_MOTOR_FAULT)
+            time.sleep(self.COMMAND_HOLD_S)
+            self._wait_bit(self.MOTOR_INPUT_CLASS, axis, self.ATTR_IN_SHUTDOWN_REG,
+                           ~self.SHUTDOWN_NON_BLOCKING, False, 0.1)
+            self._write_output_reg(axis, 0x00)
+            time.sleep(self.COMMAND_HOLD_S)
+            # Re-enable, then wait (max 50ms) for MotorDisabled to drop
+            self._write_output_reg(axis, self.BIT_ENABLE, force=True)
+            self._wait_bit(self.MOTOR_INPUT_CLASS, axis, self.ATTR_IN_SHUTDOWN_REG,
+                           0x20, False, 0.05)
+            # Registers changed under us - re-read the ack state
             status_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
                                         self.ATTR_IN_STATUS_REG)
-            ack_set = bool(status_reg & self.BIT_LOAD_VEL_MOVE_ACK) if status_reg is not None else False
-            status_hex = f"0x{status_reg:08x}" if status_reg is not None else "None"
-            self._logger.debug(f"[trigger_move] Axis {axis}: status_reg={status_hex}, ack={ack_set}")
-
-            if status_reg is not None and (status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
-                self._logger.debug(f"[trigger_move] Axis {axis}: Clearing pending ack before new move")
-                # Clear Load bit first
-                self._write_output_reg(axis, self.BIT_ENABLE)
-                # Wait for ack to clear (max 100ms)
-                for i in range(10):
-                    time.sleep(0.01)
-                    status_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                                self.ATTR_IN_STATUS_REG)
-                    if status_reg is not None and not (status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
-                        self._logger.debug(f"[trigger_move] Axis {axis}: Ack cleared after {i*10}ms")
-                        break
-
-            # Write Enable + Load Velocity Move
-            result = self._write_output_reg(axis, self.BIT_ENABLE | self.BIT_LOAD_VEL_MOVE)
-
-            return result
+
+        # Check if there's a pending ack from previous move
+        ack_set = bool(status_reg & self.BIT_LOAD_VEL_MOVE_ACK) if status_reg is not None else False
+        status_hex = f"0x{status_reg:08x}" if status_reg is not None else "None"
+        self._logger.debug(f"[trigger_move] Axis {axis}: status_reg={status_hex}, ack={ack_set}")
+
+        if status_reg is not None and (status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
+            self._logger.debug(f"[trigger_move] Axis {axis}: Clearing pending ack before new move")
+            # Clear Load bit first
+            self._write_output_reg(axis, self.BIT_ENABLE)
+            # Wait for ack to clear (max 100ms)
+            waited = self._wait_bit(self.MOTOR_INPUT_CLASS, axis, self.ATTR_IN_STATUS_REG,
+                                    self.BIT_LOAD_VEL_MOVE_ACK, False, 0.1)
+            if waited is not None:
+                self._logger.debug(f"[trigger_move] Axis {axis}: Ack cleared after {waited*1000:.0f}ms")
+
+        # Write Enable + Load Velocity Move
+        result = self._write_output_reg(axis, trigger)
+
+        return result
 
     def stop_motor(self, axis: int) -> bool:
         """Stop a motor but keep it enabled.
@@ -485,162 +1298,253 @@ class ClearLinkEIP:
         CRITICAL: The Load bit (0x10) must be cleared after stop, otherwise
         subsequent jog commands will be ignored by ClearLink.
         """
-        if axis < 1 or axis > self._num_axes:
+        if axis not in self._axes:
             return False
+        return self._stop_axes([axis])[axis]
+
+    def stop_motors(self, axes: List[int]) -> Dict[int, bool]:
+        """Stop several motors at once, keeping them enabled.
+
+        Runs stop_motor's handshake on every axis together, each step
+        in one request.
+
+        Returns:
+            Dict mapping each requested axis to its success
+        """
+        results = {axis: False for axis in axes}
+        results.update(self._stop_axes(axes))
+        return results
 
-        with self._lock:
+    def stop_all(self) -> bool:
+        """Stop all motors."""
+        results = self._stop_axes(self._axes)
+        return all(results.values())
+
+    def _stop_axes(self, axes: Iterable[int]) -> Dict[int, bool]:
+        """Run stop_motor's handshake on several axes at once.
+
+        Every step goes to all axes in one request, and the ack waits
+        share one polling loop, so stopping N axes costs about as many
+        round-trips as stopping one.
+
+        Returns:
+            Dict mapping each axis to whether its Load bit was verified clear
+        """
+        axes = self._valid_axes(axes)
+        if not axes:
+            return {}
+        ack = self.BIT_LOAD_VEL_MOVE_ACK
+        trigger = self.BIT_ENABLE | self.BIT_LOAD_VEL_MOVE
+
+        with self._command():
             # Step 1: Clear any pending ack from previous move
-            status_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                        self.ATTR_IN_STATUS_REG)
-            if status_reg is not None and (status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
-                self._logger.info(f"[stop_motor] Axis {axis}: Clearing pending ack first")
-                self._write_output_reg(axis, self.BIT_ENABLE)  # Clear load bit
+            statuses = self._read_attr_multi(self.MOTOR_INPUT_CLASS,
+                                             self.ATTR_IN_STATUS_REG, axes)
+            pending = [axis for axis in axes
+                       if statuses[axis] is not None and statuses[axis] & ack]
+            if pending:
+                self._logger.info(f"[stop_motor] Axes {pending}: Clearing pending ack first")
+                self._write_output_regs({axis: self.BIT_ENABLE for axis in pending})  # Clear load bit
                 # Wait for ack to clear
-                for i in range(50):
-                    status_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                                self.ATTR_IN_STATUS_REG)
-                    if status_reg is not None and not (status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
-                        self._logger.info(f"[stop_motor] Axis {axis}: Pending ack cleared after {i*10}ms")
-                        break
-                    time.sleep(0.01)
-
-            # Step 2: Set velocity to 0
-            self._logger.debug(f"[stop_motor] Axis {axis}: Setting velocity to 0")
-            self._write_attr(self.MOTOR_OUTPUT_CLASS, axis,
-                           self.ATTR_OUT_JOG_VEL, 0)
-
-            # Step 3: Trigger the zero-velocity move
-            self._logger.debug(f"[stop_motor] Axis {axis}: Triggering with 0x11")
-            self._write_output_reg(axis, self.BIT_ENABLE | self.BIT_LOAD_VEL_MOVE)
+                statuses = self._wait_bits(self.ATTR_IN_STATUS_REG, pending, ack, False, 0.5)
+                for axis in pending:
+                    if statuses[axis] is not None and not statuses[axis] & ack:
+                        self._logger.info(f"[stop_motor] Axis {axis}: Pending ack cleared")
+
+            # Steps 2+3: Set velocity to 0 and trigger the zero-velocity move
+            self._logger.debug(f"[stop_motor] Axes {axes}: Setting velocity to 0, triggering with 0x11")
+            requests = []
+            for axis in axes:
+                requests += [
+                    (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                     self.ATTR_OUT_JOG_VEL, _encode_dint(0)),
+                    (self.SVC_SET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                     self.ATTR_OUT_OUTPUT_REG, _UDINT.pack(trigger)),
+                ]
+            replies = self.multi_service(requests)
+            for n, axis in enumerate(axes):
+                if replies[n * 2 + 1] is not None:
+                    self._output_reg[axis - 1] = trigger
 
             # Step 4: Wait for Load Vel Move Ack (bit 20) to become 1
-            ack_found = False
-            for i in range(50):  # Max 500ms
-                status_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                            self.ATTR_IN_STATUS_REG)
-                if status_reg is not None and (status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
-                    ack_found = True
-                    self._logger.debug(f"[stop_motor] Axis {axis}: Ack found after {i*10}ms")
-                    break
-                time.sleep(0.01)
-            if not ack_found:
-                self._logger.warning(f"[stop_motor] Axis {axis}: Ack NOT found after 500ms")
+            statuses = self._wait_bits(self.ATTR_IN_STATUS_REG, axes, ack, True, 0.5)  # Max 500ms
+            for axis in axes:
+                if statuses[axis] is not None and statuses[axis] & ack:
+                    self._logger.debug(f"[stop_motor] Axis {axis}: Ack found")
+                else:
+                    self._logger.warning(f"[stop_motor] Axis {axis}: Ack NOT found after 500ms")
 
             # Step 5: Clear load bit but keep enabled - WITH VERIFICATION
             # This is critical - if Load bit stays set, motor won't respond to new commands
-            clear_success = False
+            cleared = {axis: False for axis in axes}
+            statuses = {axis: None for axis in axes}
+            remaining = list(axes)
             for attempt in range(3):  # Try up to 3 times
-                self._logger.debug(f"[stop_motor] Axis {axis}: Clearing to 0x01 (attempt {attempt+1})")
-                self._write_output_reg(axis, self.BIT_ENABLE)
+                self._logger.debug(f"[stop_motor] Axes {remaining}: Clearing to 0x01 (attempt {attempt+1})")
+                # Forced: a retry means the controller disagrees with our cache
+                self._write_output_regs({axis: self.BIT_ENABLE for axis in remaining}, force=True)
                 time.sleep(0.02)  # Short delay for write to take effect
 
-                # Verify the write succeeded by reading back Output Register
-                out_reg = self._read_attr(self.MOTOR_OUTPUT_CLASS, axis, self.ATTR_OUT_OUTPUT_REG)
-                if out_reg is not None:
-                    if not (out_reg & self.BIT_LOAD_VEL_MOVE):
+                # Verify the write succeeded by reading back Output Register,
+                # picking up the Status Register (for step 6) in the same request
+                requests = []
+                for axis in remaining:
+                    requests += [
+                        (self.SVC_GET_ATTR_SINGLE, self.MOTOR_OUTPUT_CLASS, axis,
+                         self.ATTR_OUT_OUTPUT_REG, b''),
+                        (self.SVC_GET_ATTR_SINGLE, self.MOTOR_INPUT_CLASS, axis,
+                         self.ATTR_IN_STATUS_REG, b''),
+                    ]
+                replies = self.multi_service(requests)
+                retry = []
+                for n, axis in enumerate(remaining):
+                    out_reg = _decode_dint(replies[n * 2])
+                    statuses[axis] = _decode_dint(replies[n * 2 + 1])
+                    if out_reg is None:
+                        self._logger.warning(f"[stop_motor] Axis {axis}: Failed to read output reg for verification")
+                        retry.append(axis)
+                    elif out_reg & self.BIT_LOAD_VEL_MOVE:
+                        self._logger.warning(f"[stop_motor] Axis {axis}: Output reg still 0x{out_reg:02x}, retrying")
+                        retry.append(axis)
+                    else:
                         # Load bit is cleared
-                        clear_success = True
+                        cleared[axis] = True
                         self._logger.debug(f"[stop_motor] Axis {axis}: Output reg verified as 0x{out_reg:02x}")
-                        break
-                    else:
-                        self._logger.warning(f"[stop_motor] Axis {axis}: Output reg still 0x{out_reg:02x}, retrying")
-                else:
-                    self._logger.warning(f"[stop_motor] Axis {axis}: Failed to read output reg for verification")
-
-            if not clear_success:
-                self._logger.error(f"[stop_motor] Axis {axis}: FAILED to clear Load bit after 3 attempts!")
-
-            # Step 6: Wait for ack bit to clear in Status Register
-            ack_cleared = False
-            for i in range(50):  # Max 500ms
-                status_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                            self.ATTR_IN_STATUS_REG)
-                if status_reg is not None and not (status_reg & self.BIT_LOAD_VEL_MOVE_ACK):
-                    ack_cleared = True
-                    self._logger.debug(f"[stop_motor] Axis {axis}: Ack cleared after {i*10}ms")
+                remaining = retry
+                if not remaining:
                     break
-                time.sleep(0.01)
 
-            if not ack_cleared:
-                self._logger.warning(f"[stop_motor] Axis {axis}: Status Ack bit did not clear after 500ms")
+            for axis in remaining:
+                self._logger.error(f"[stop_motor] Axis {axis}: FAILED to clear Load bit after 3 attempts!")
 
-            return clear_success
+            # Step 6: Wait for ack bit to clear in Status Register. Usually
+            # it already has by the time the verification read above ran.
+            waiting = [axis for axis in axes
+                       if statuses[axis] is None or statuses[axis] & ack]
+            if waiting:
+                statuses = self._wait_bits(self.ATTR_IN_STATUS_REG, waiting, ack, False, 0.5)  # Max 500ms
+                for axis in waiting:
+                    if statuses[axis] is None or statuses[axis] & ack:
+                        self._logger.warning(f"[stop_motor] Axis {axis}: Status Ack bit did not clear after 500ms")
 
-    def stop_all(self) -> bool:
-        """Stop all motors."""
-        success = True
-        for axis in range(1, self._num_axes + 1):
-            if not self.stop_motor(axis):
-                success = False
-        return success
+            return cleared
 
     # Status Reading Methods
 
     def get_axis_status(self, axis: int) -> AxisStatus:
         """Read complete status for one axis."""
-        status = AxisStatus()
-
-        if axis < 1 or axis > self._num_axes:
-            return status
+        if axis not in self._axes:
+            return _DEFAULT_AXIS
 
         if not self._connected:
-            return status
+            return _DEFAULT_AXIS
 
-        with self._lock:
-            # Read status register
-            status_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                        self.ATTR_IN_STATUS_REG)
-            if status_reg is not None:
-                status.enabled = bool(status_reg & self.BIT_ENABLED)
-                status.moving = bool(status_reg & self.BIT_STEPS_ACTIVE)
-                # Homed bit - check if ReadyToHome bit is clear (bit 12)
-                status.homed = not bool(status_reg & (1 << 12))
-
-            # Read shutdown register - use this for fault detection
-            shutdown_reg = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                          self.ATTR_IN_SHUTDOWN_REG)
-            if shutdown_reg is not None:
-                status.shutdown = shutdown_reg
-                # Use shutdown register for fault detection instead of status register
-                # These bits are normal/informational and don't block operation:
-                # - 0x01: TrackingError - appears but doesn't prevent movement
-                # - 0x20: MotorDisabled - normal when not moving
-                # - 0x400: Bit 10 - informational
-                non_blocking = 0x421  # TrackingError + MotorDisabled + bit 10
-                blocking_faults = shutdown_reg & ~non_blocking
-                status.fault = blocking_faults != 0
-
-            # Read position
-            pos = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                 self.ATTR_IN_CMD_POSITION)
-            if pos is not None:
-                status.position = pos
-
-            # Read velocity
-            vel = self._read_attr(self.MOTOR_INPUT_CLASS, axis,
-                                 self.ATTR_IN_CMD_VELOCITY)
-            if vel is not None:
-                status.velocity = vel
-
-            # Read torque (REAL value, -100 to +100%, -9999 = N/A)
-            torque = self._read_attr_float(self.MOTOR_INPUT_CLASS, axis,
-                                          self.ATTR_IN_TORQUE)
-            if torque is not None:
-                status.torque = torque
-
-        return status
+        with self._lock.read_locked():
+            # Status, shutdown, position, velocity and torque in one request
+            replies = self._read_status_attrs([axis])[0]
+        return self._parse_axis_status(_decode_status_row(replies))
 
-    def get_all_status(self) -> ClearLinkStatus:
-        """Read complete status from ClearLink."""
-        status = ClearLinkStatus()
-        status.connected = self._connected
-        status.connection_error = self._connection_error
+    def _parse_axis_status(self, values: StatusValues) -> AxisStatus:
+        """Build an AxisStatus from decoded STATUS_ATTRS values.
 
-        if not self._connected:
-            return status
+        Fields whose read failed (None) keep their defaults.
+        """
+        status_reg, shutdown_reg, position, velocity, torque = values
+
+        enabled = moving = homed = fault = False
+        shutdown = 0
+
+        # Status register
+        if status_reg is not None:
+            enabled = bool(status_reg & self.BIT_ENABLED)
+            moving = bool(status_reg & self.BIT_STEPS_ACTIVE)
+            # Homed bit - check if ReadyToHome bit is clear (bit 12)
+            homed = not bool(status_reg & (1 << 12))
+
+        # Shutdown register - use this for fault detection
+        if shutdown_reg is not None:
+            shutdown = shutdown_reg
+            # Use shutdown register for fault detection instead of status register
+            # These bits are normal/informational and don't block operation:
+            # - 0x01: TrackingError - appears but doesn't prevent movement
+            # - 0x20: MotorDisabled - normal when not moving
+            # - 0x400: Bit 10 - informational
+            blocking_faults = shutdown_reg & ~self.SHUTDOWN_NON_BLOCKING
+            fault = blocking_faults != 0
+
+        return AxisStatus(
+            enabled=enabled,
+            fault=fault,
+            moving=moving,
+            homed=homed,
+            position=position if position is not None else 0,
+            velocity=velocity if velocity is not None else 0,
+            # Torque (REAL value, -100 to +100%, -9999 = N/A)
+            torque=torque if torque is not None else -9999.0,
+            shutdown=shutdown,
+        )
 
-        # Read status for each axis
-        for i in range(self._num_axes):
-            status.axes[i] = self.get_axis_status(i + 1)
+    def get_all_status(self) -> ClearLinkStatus:
+        """Read complete status from ClearLink.
 
-        return status
+        With the background poller running this returns its latest
+        snapshot without any I/O.
+        """
+        latest = self._latest
+        if latest is not None:
+            return latest
+        return self.get_all_status_fresh()
+
+    def get_all_status_fresh(self) -> ClearLinkStatus:
+        """Read complete status from ClearLink now, bypassing the poller."""
+        if not self._connected:
+            return ClearLinkStatus(connected=False,
+                                   connection_error=self._connection_error)
+
+        # Every axis's status reads go out together in one request
+        with self._lock.read_locked():
+            rows = self._read_status_attrs(self._axes)
+
+        # Parse each axis, packing fault bits as they are parsed
+        axes = []
+        mask = 0
+        for i, values in enumerate(_decode_status_rows(rows)):
+            axis_status = self._parse_axis_status(values)
+            if axis_status.fault:
+                mask |= 1 << i
+            axes.append(axis_status)
+        axes += _DEFAULT_AXES[len(axes):]
+
+        # Connection state is sampled after the reads, which can change it
+        return ClearLinkStatus(
+            connected=self._connected,
+            connection_error=self._connection_error,
+            axes=tuple(axes),
+            fault_mask=mask,
+        )
+
+    def latest_status(self) -> Optional[ClearLinkStatus]:
+        """Latest background poller snapshot, or None if not polling."""
+        return self._latest
+
+    def get_fault_mask(self) -> int:
+        """Read only the fault state of every axis, in one round-trip.
+
+        Fault detection uses the Shutdown Register, same as get_axis_status,
+        so this skips the status, position, velocity and torque reads.
+
+        Returns:
+            Bitmask with bit (axis - 1) set for each faulted axis
+        """
+        if not self._connected:
+            return 0
+
+        with self._lock.read_locked():
+            shutdowns = self._read_attr_multi(self.MOTOR_INPUT_CLASS,
+                                              self.ATTR_IN_SHUTDOWN_REG,
+                                              self._axes)
+        mask = 0
+        for axis, shutdown in shutdowns.items():
+            if shutdown is not None and shutdown & ~self.SHUTDOWN_NON_BLOCKING:
+                mask |= 1 << (axis - 1)
+        return mask
@@ -6,16 +6,32 @@ Provides publishers, subscribers, and services for motor control.
 """
 
 import rclpy
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
+from rclpy.executors import MultiThreadedExecutor
 from rclpy.node import Node
 from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy
-import threading
 import time
+from operator import attrgetter
 
 from std_msgs.msg import Header
 from clearlink_interfaces.msg import MotorCommand, MotorStatus
 from clearlink_interfaces.srv import ClearFaults, Home
 
 from .clearlink_control import ClearLinkControl
+from .clearlink_eip import AxisStatus
+
+
+# Per-axis MotorCommand fields, fetched for all axes in one call each
+_CMD_ENABLES = attrgetter('axis1_enable', 'axis2_enable', 'axis3_enable', 'axis4_enable')
+_CMD_STEPS = attrgetter('axis1_steps_per_sec', 'axis2_steps_per_sec',
+                        'axis3_steps_per_sec', 'axis4_steps_per_sec')
+
+# Per axis, the (MotorStatus field, AxisStatus field) pairs it publishes
+_STATUS_FIELDS = ('enabled', 'fault', 'moving', 'homed', 'position', 'velocity', 'torque')
+_AXIS_MSG_FIELDS = tuple(
+    tuple((f'axis{n}_{field}', field) for field in _STATUS_FIELDS)
+    for n in range(1, 5)
+)
 
 
 class ClearLinkNode(Node):
@@ -37,6 +53,8 @@ class ClearLinkNode(Node):
         port (int): EtherNet/IP port (default: 44818)
         num_axes (int): Number of motor axes (default: 4)
         loop_hz (float): Status publish rate in Hz (default: 10)
+        status_poll_hz (float): Background controller poll rate in Hz, decoupled
+            from loop_hz (default: 0 = read status from the main loop)
         deadman_secs (float): Timeout before auto-stop (default: 3.0)
         status_topic (str): Status topic name (default: /clearlink/status)
         command_topic (str): Command topic name (default: /clearlink/command)
@@ -47,6 +65,7 @@ class ClearLinkNode(Node):
     PARAM_PORT = 'port'
     PARAM_NUM_AXES = 'num_axes'
     PARAM_LOOP_HZ = 'loop_hz'
+    PARAM_STATUS_POLL_HZ = 'status_poll_hz'
     PARAM_DEADMAN_SECS = 'deadman_secs'
     PARAM_STATUS_TOPIC = 'status_topic'
     PARAM_COMMAND_TOPIC = 'command_topic'
@@ -59,6 +78,7 @@ class ClearLinkNode(Node):
         self.declare_parameter(self.PARAM_PORT, 44818)
         self.declare_parameter(self.PARAM_NUM_AXES, 4)
         self.declare_parameter(self.PARAM_LOOP_HZ, 10.0)
+        self.declare_parameter(self.PARAM_STATUS_POLL_HZ, 0.0)
         self.declare_parameter(self.PARAM_DEADMAN_SECS, 3.0)
         self.declare_parameter(self.PARAM_STATUS_TOPIC, '/clearlink/status')
         self.declare_parameter(self.PARAM_COMMAND_TOPIC, '/clearlink/command')
@@ -68,6 +88,7 @@ class ClearLinkNode(Node):
         port = self.get_parameter(self.PARAM_PORT).value
         num_axes = self.get_parameter(self.PARAM_NUM_AXES).value
         loop_hz = self.get_parameter(self.PARAM_LOOP_HZ).value
+        status_poll_hz = self.get_parameter(self.PARAM_STATUS_POLL_HZ).value
         self._deadman_secs = self.get_parameter(self.PARAM_DEADMAN_SECS).value
         status_topic = self.get_parameter(self.PARAM_STATUS_TOPIC).value
         command_topic = self.get_parameter(self.PARAM_COMMAND_TOPIC).value
@@ -75,15 +96,27 @@ class ClearLinkNode(Node):
         self.get_logger().info(f"ClearLink node starting: {ip_address}:{port}")
 
         # Initialize control layer
-        self._control = ClearLinkControl(ip_address, port, num_axes)
+        poll_period = 1.0 / status_poll_hz if status_poll_hz > 0 else 0.0
+        self._control = ClearLinkControl(ip_address, port, num_axes,
+                                         poll_period=poll_period)
         self._num_axes = num_axes
 
         # Command tracking for deadman switch
-        self._last_cmd_time = time.time()
-        self._cmd_lock = threading.RLock()
+        # Deadline as a time.monotonic_ns() value, pushed out by each command.
+        # Single int stores and loads, so no lock is needed between the
+        # command callback and the main loop.
+        self._deadman_ns = int(self._deadman_secs * 1e9)
+        self._deadman_deadline_ns = time.monotonic_ns() + self._deadman_ns
         # Track if we've received first move command (need clear_faults before first move)
         self._first_move_done = False
 
+        # The status loop, commands and services each run in their own group
+        # on the multi-threaded executor (see main), so a slow controller
+        # round-trip in one never holds up the others
+        self._loop_group = MutuallyExclusiveCallbackGroup()
+        self._command_group = MutuallyExclusiveCallbackGroup()
+        self._service_group = MutuallyExclusiveCallbackGroup()
+
         # QoS profile - use VOLATILE durability to receive from all publishers
         # (both rosbridge TRANSIENT_LOCAL and motor_controller VOLATILE)
         qos = QoSProfile(
@@ -104,20 +137,23 @@ class ClearLinkNode(Node):
             MotorCommand,
             command_topic,
             self._command_callback,
-            qos
+            qos,
+            callback_group=self._command_group
         )
 
         # Create services
         self.clear_faults_srv = self.create_service(
             ClearFaults,
             '/clearlink/clear_faults',
-            self._clear_faults_callback
+            self._clear_faults_callback,
+            callback_group=self._service_group
         )
 
         self.home_srv = self.create_service(
             Home,
             '/clearlink/home',
-            self._home_callback
+            self._home_callback,
+            callback_group=self._service_group
         )
 
         # Initialize connection
@@ -131,13 +167,31 @@ class ClearLinkNode(Node):
             # Auto-enable motors if no faults detected
             self._auto_enable_motors()
 
+        # Status message reused by every publish; only the stamp and the
+        # fields of a changed snapshot or axis are written each cycle
+        self._status_msg = MotorStatus()
+        self._status_msg.header.frame_id = 'clearlink'
+        self._published_status = None
+        # Specialized to num_axes once here: the per-cycle loops only see
+        # this node's axes, with no length checks
+        self._axis_msg_fields = _AXIS_MSG_FIELDS[:num_axes]
+        self._published_axes = [None] * len(self._axis_msg_fields)
+        # Axes past num_axes are never written again; give them the
+        # AxisStatus defaults (torque -9999 = N/A) once, as published
+        # before the message was reused
+        unused_axis = AxisStatus()
+        for fields in _AXIS_MSG_FIELDS[num_axes:]:
+            for msg_field, status_field in fields:
+                setattr(self._status_msg, msg_field, getattr(unused_axis, status_field))
+
         # Reconnect tracking
         self._reconnect_interval = 5.0
         self._last_reconnect_attempt = 0.0
 
         # Create main loop timer
         loop_period = 1.0 / loop_hz
-        self.create_timer(loop_period, self._main_loop)
+        self.create_timer(loop_period, self._main_loop,
+                          callback_group=self._loop_group)
 
         self.get_logger().info("ClearLink node started")
 
@@ -162,7 +216,7 @@ class ClearLinkNode(Node):
         else:
             # Check which axes failed
             status = self._control.read_status()
-            faulted = [i+1 for i, ax in enumerate(status.axes[:self._num_axes]) if ax.fault]
+            faulted = [i+1 for i in range(self._num_axes) if status.fault_mask >> i & 1]
             if faulted:
                 self.get_logger().warn(
                     f"Some axes have faults after enable attempt: {faulted}"
@@ -196,108 +250,56 @@ class ClearLinkNode(Node):
         # Read status
         status = self._control.read_status()
 
-        # Create and publish status message
-        msg = MotorStatus()
-        msg.header = Header()
+        # Update and publish the status message
+        msg = self._status_msg
         msg.header.stamp = self.get_clock().now().to_msg()
-        msg.header.frame_id = 'clearlink'
-
-        msg.connected = status.connected
-        msg.connection_error = status.connection_error
-
-        # Axis states
-        if len(status.axes) >= 1:
-            msg.axis1_enabled = status.axes[0].enabled
-            msg.axis1_fault = status.axes[0].fault
-            msg.axis1_moving = status.axes[0].moving
-            msg.axis1_homed = status.axes[0].homed
-            msg.axis1_position = status.axes[0].position
-            msg.axis1_velocity = status.axes[0].velocity
-            msg.axis1_torque = status.axes[0].torque
-
-        if len(status.axes) >= 2:
-            msg.axis2_enabled = status.axes[1].enabled
-            msg.axis2_fault = status.axes[1].fault
-            msg.axis2_moving = status.axes[1].moving
-            msg.axis2_homed = status.axes[1].homed
-            msg.axis2_position = status.axes[1].position
-            msg.axis2_velocity = status.axes[1].velocity
-            msg.axis2_torque = status.axes[1].torque
-
-        if len(status.axes) >= 3:
-            msg.axis3_enabled = status.axes[2].enabled
-            msg.axis3_fault = status.axes[2].fault
-            msg.axis3_moving = status.axes[2].moving
-            msg.axis3_homed = status.axes[2].homed
-            msg.axis3_position = status.axes[2].position
-            msg.axis3_velocity = status.axes[2].velocity
-            msg.axis3_torque = status.axes[2].torque
-
-        if len(status.axes) >= 4:
-            msg.axis4_enabled = status.axes[3].enabled
-            msg.axis4_fault = status.axes[3].fault
-            msg.axis4_moving = status.axes[3].moving
-            msg.axis4_homed = status.axes[3].homed
-            msg.axis4_position = status.axes[3].position
-            msg.axis4_velocity = status.axes[3].velocity
-            msg.axis4_torque = status.axes[3].torque
-
-        # Digital I/O
-        if status.digital_inputs:
-            msg.digital_inputs = status.digital_inputs
-        if status.digital_outputs:
-            msg.digital_outputs = status.digital_outputs
-
-        msg.firmware_version = status.firmware_version
-        msg.supply_voltage = status.supply_voltage
+
+        # A poller snapshot is often published more than once; skip
+        # rewriting it, and any axis whose status did not change
+        if status is not self._published_status:
+            self._published_status = status
+            msg.connected = status.connected
+            msg.connection_error = status.connection_error
+
+            # Axis states
+            published = self._published_axes
+            for i, (fields, axis_status) in enumerate(zip(self._axis_msg_fields, status.axes)):
+                if axis_status == published[i]:
+                    continue
+                published[i] = axis_status
+                for msg_field, status_field in fields:
+                    setattr(msg, msg_field, getattr(axis_status, status_field))
+
+            # Digital I/O
+            if status.digital_inputs:
+                msg.digital_inputs = status.digital_inputs
+            if status.digital_outputs:
+                msg.digital_outputs = status.digital_outputs
+
+            msg.firmware_version = status.firmware_version
+            msg.supply_voltage = status.supply_voltage
 
         self.status_pub.publish(msg)
 
         # Check deadman switch
-        with self._cmd_lock:
-            time_since_cmd = time.time() - self._last_cmd_time
-
-        if self._deadman_secs > 0 and time_since_cmd > self._deadman_secs:
+        if self._deadman_secs > 0 and time.monotonic_ns() > self._deadman_deadline_ns:
             # No command received recently - stop motors
             # Only log once when transitioning to stopped state
             pass  # Deadman currently disabled to match roboclaw behavior
 
     def _command_callback(self, msg: MotorCommand):
         """Handle incoming motor command."""
-        with self._cmd_lock:
-            self._last_cmd_time = time.time()
+        self._deadman_deadline_ns = time.monotonic_ns() + self._deadman_ns
 
         # Build velocity list from message
-        velocities = [
-            msg.axis1_steps_per_sec if msg.axis1_enable else 0,
-            msg.axis2_steps_per_sec if msg.axis2_enable else 0,
-            msg.axis3_steps_per_sec if msg.axis3_enable else 0,
-            msg.axis4_steps_per_sec if msg.axis4_enable else 0,
-        ]
+        num_axes = self._num_axes
+        enables = _CMD_ENABLES(msg)[:num_axes]
+        velocities = [steps if enable else 0
+                      for enable, steps in zip(enables, _CMD_STEPS(msg)[:num_axes])]
 
         # Enable/disable motors as requested
-        enable_axes = []
-        disable_axes = []
-
-        if msg.axis1_enable:
-            enable_axes.append(1)
-        else:
-            disable_axes.append(1)
-
-        if msg.axis2_enable:
-            enable_axes.append(2)
-        else:
-            disable_axes.append(2)
-
-        if msg.axis3_enable:
-            enable_axes.append(3)
-        else:
-            disable_axes.append(3)
-
-        if msg.axis4_enable:
-            enable_axes.append(4)
-        else:
-            disable_axes.append(4)
+        enable_axes = [axis for axis, enable in enumerate(enables, 1) if enable]
+        disable_axes = [axis for axis, enable in enumerate(enables, 1) if not enable]
 
         # Apply enables
         if enable_axes:
@@ -311,8 +313,8 @@ class ClearLinkNode(Node):
             self._control.clear_faults(enable_axes)
             self._first_move_done = True
 
-        self.get_logger().info(f"Calling drive_velocity with velocities={velocities[:self._num_axes]}, accel={accel}")
-        result = self._control.drive_velocity(velocities[:self._num_axes], accel)
+        self.get_logger().info(f"Calling drive_velocity with velocities={velocities}, accel={accel}")
+        result = self._control.drive_velocity(velocities, accel)
         self.get_logger().info(f"drive_velocity returned {result}")
 
         # Apply disables
@@ -380,9 +382,11 @@ def main(args=None):
     rclpy.init(args=args)
 
     node = ClearLinkNode()
+    executor = MultiThreadedExecutor()
+    executor.add_node(node)
 
     try:
-        rclpy.spin(node)
+        executor.spin()
     except KeyboardInterrupt:
         pass
     finally:
@@ -0,0 +1,538 @@
+"""
+ClearLink EtherNet/IP Discovery
+
+Probes CIP classes, instances and attributes on a ClearLink to find out
+what the device exposes. Get_Attribute_Single probes are packed into
+Multiple Service Packets, so a sweep costs one round-trip per batch.
+
+object_scan() and deep_scan() take an already opened CIPDriver, so both
+can run on one session; main() (the ``discover`` console script) does
+exactly that. scripts/discover_clearlink*.py run one scan each.
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from pycomm3 import CIPDriver, PycommError
+
+from .clearlink_eip import ClearLinkEIP, encode_epath, uint_array
+
+
+# Default device address; the CLEARLINK_IP environment variable or --ip
+# override it
+CLEARLINK_IP = "192.168.20.240"
+
+# (class, instance, attribute) of one probe
+Probe = Tuple[int, int, int]
+# Probes paired with their encoded Get_Attribute_Single requests
+ScanPlan = Tuple[Tuple[Probe, bytes], ...]
+# Attribute data from a scan: bytes from a single read, or a zero-copy
+# view into a Multiple Service Packet reply
+AttrData = Union[bytes, memoryview]
+
+# Service codes, resolved once rather than on every request
+GET_ATTRIBUTE_SINGLE = ClearLinkEIP.SVC_GET_ATTR_SINGLE
+MULTIPLE_SERVICE = ClearLinkEIP.SVC_MULTIPLE_SERVICE
+MESSAGE_ROUTER_CLASS = 0x02
+# CIP general status for a request addressed to a class the device lacks
+PATH_DESTINATION_UNKNOWN = 0x05
+# Get_Attribute_Single requests per packet; keeps request and reply
+# comfortably inside a standard 500-byte connection
+BATCH_SIZE = 20
+
+# Known ClearLink class IDs
+MOTOR_OUTPUT_BASE = 0x66  # Motor 1-4 output: 0x66-0x69
+MOTOR_INPUT_BASE = 0x6A   # Motor 1-4 input: 0x6A-0x6D
+
+# Standard CIP class IDs
+IDENTITY_CLASS = 0x01
+ASSEMBLY_CLASS = 0x04
+CONNECTION_MANAGER = 0x06
+ANALOG_INPUT_CLASS = 0x0A
+ANALOG_OUTPUT_CLASS = 0x0B
+DISCRETE_INPUT_CLASS = 0x08
+DISCRETE_OUTPUT_CLASS = 0x09
+
+# Possible ClearLink-specific classes
+CLEARLINK_SYSTEM_CLASS = 0x64  # Guess - system info
+CLEARLINK_IO_CLASS = 0x65      # Guess - digital I/O
+
+# Identity object attributes: attr -> (name, data type)
+IDENTITY_ATTRS = {
+    1: ('Vendor ID', 'UINT'),
+    2: ('Device Type', 'UINT'),
+    3: ('Product Code', 'UINT'),
+    4: ('Revision', 'raw'),
+    5: ('Status', 'UINT'),
+    6: ('Serial Number', 'UDINT'),
+    7: ('Product Name', 'STRING'),
+}
+
+# Classes probed at instance 1 by the class scan
+CLASSES_TO_CHECK = [
+    (0x04, "Assembly"),
+    (0x64, "ClearLink System?"),
+    (0x65, "ClearLink I/O?"),
+    (0x66, "Motor 1 Output"),
+    (0x67, "Motor 2 Output"),
+    (0x68, "Motor 3 Output"),
+    (0x69, "Motor 4 Output"),
+    (0x6A, "Motor 1 Input"),
+    (0x6B, "Motor 2 Input"),
+    (0x6C, "Motor 3 Input"),
+    (0x6D, "Motor 4 Input"),
+    (0x6E, "Unknown 0x6E"),
+    (0x6F, "Unknown 0x6F"),
+    (0x70, "Unknown 0x70"),
+    (0x71, "Unknown 0x71"),
+    (0x72, "Unknown 0x72"),
+    (0x73, "Unknown 0x73"),
+    (0x74, "Unknown 0x74"),
+    (0x75, "Unknown 0x75"),
+    (0x0A, "Analog Input"),
+    (0x0B, "Analog Output"),
+    (0x08, "Discrete Input"),
+    (0x09, "Discrete Output"),
+]
+
+ASSEMBLY_INSTANCES = (100, 101, 102, 103, 104, 105, 150, 151, 152)
+
+# Precompiled little-endian decoders (read from offset 0, no slicing)
+_U16 = struct.Struct('<H').unpack_from
+_S16 = struct.Struct('<h').unpack_from
+_U32 = struct.Struct('<I').unpack_from
+_S32 = struct.Struct('<i').unpack_from
+_F32 = struct.Struct('<f').unpack_from
+
+# read_attribute data types: name -> (minimum length, decoder)
+_DECODERS = {
+    'BOOL': (1, lambda data: bool(data[0])),
+    'USINT': (1, lambda data: data[0]),
+    'UINT': (2, lambda data: _U16(data)[0]),
+    'INT': (2, lambda data: _S16(data)[0]),
+    'UDINT': (4, lambda data: _U32(data)[0]),
+    'DINT': (4, lambda data: _S32(data)[0]),
+    'REAL': (4, lambda data: _F32(data)[0]),
+    'STRING': (0, lambda data: data.decode('utf-8', errors='ignore').rstrip('\x00')),
+}
+_HEX_DECODER = (0, lambda data: data.hex())
+
+
+def probes(classes: Iterable[int], instances: Iterable[int],
+           attrs: Iterable[int]) -> List[Probe]:
+    """Every (class, instance, attribute) combination, in scan order."""
+    return [(c, i, a) for c in classes for i in instances for a in attrs]
+
+
+def build_plan(items: Iterable[Probe]) -> ScanPlan:
+    """Pair each probe with its encoded Get_Attribute_Single request.
+
+    Encoding once up front keeps EPATH building out of scan(), and lets
+    fixed scans be built at import time.
+    """
+    plan = []
+    for item in items:
+        path = encode_epath(*item)
+        plan.append((item, bytes((GET_ATTRIBUTE_SINGLE, len(path) // 2)) + path))
+    return tuple(plan)
+
+
+def read_raw(driver: CIPDriver, class_id: int, instance: int,
+             attribute: int) -> Optional[bytes]:
+    """Read a single attribute, return raw bytes."""
+    try:
+        result = driver.generic_message(
+            service=GET_ATTRIBUTE_SINGLE,
+            class_code=class_id,
+            instance=instance,
+            attribute=attribute
+        )
+    except PycommError:
+        return None
+    if result and result.value:
+        return result.value
+    return None
+
+
+def read_attribute(driver: CIPDriver, class_id: int, instance: int,
+                   attribute: int, data_type: str = 'raw'):
+    """Read a single attribute and decode it as data_type.
+
+    Unknown types, and data too short for the requested type, come back
+    as a hex string.
+    """
+    data = read_raw(driver, class_id, instance, attribute)
+    if not data:
+        return None
+    size, decode = _DECODERS.get(data_type, _HEX_DECODER)
+    return decode(data) if len(data) >= size else data.hex()
+
+
+def _send_batch(driver: CIPDriver, batch: ScanPlan) -> Optional[List[Tuple[int, AttrData]]]:
+    """Send one Multiple Service Packet.
+
+    Returns:
+        (general status, data) per request, in order, or None if the
+        device rejected the packet as a whole
+    """
+    count = len(batch)
+    offsets = []
+    offset = 2 + 2 * count
+    for _, request in batch:
+        offsets.append(offset)
+        offset += len(request)
+    payload = uint_array(count + 1).pack(count, *offsets) + b''.join(
+        request for _, request in batch)
+
+    try:
+        result = driver.generic_message(
+            service=MULTIPLE_SERVICE,
+            class_code=MESSAGE_ROUTER_CLASS,
+            instance=1,
+            request_data=payload
+        )
+    except PycommError:
+        return None
+    reply = result.value if result is not None else None
+    if not reply or len(reply) < 2 + 2 * count:
+        return None
+
+    # Slice replies out of a view so each one is not copied
+    view = memoryview(reply)
+    reply_offsets = list(uint_array(count).unpack_from(view, 2)) + [len(view)]
+    replies = []
+    for n in range(count):
+        start, end = reply_offsets[n], reply_offsets[n + 1]
+        replies.append((view[start + 2], view[start + 4 + 2 * view[start + 3]:end]))
+    return replies
+
+
+def scan(driver: CIPDriver, plan: ScanPlan,
+         batch_size: int = BATCH_SIZE) -> Dict[Probe, Optional[AttrData]]:
+    """Run a scan plan with Multiple Service Packets.
+
+    Each packet carries up to batch_size Get_Attribute_Single requests,
+    so a scan costs one round-trip per batch instead of one per
+    attribute. If the device rejects a packet as a whole, its probes
+    are read one at a time.
+
+    Returns:
+        Dict mapping each probe to its raw reply data, or None if the
+        read failed or returned nothing
+    """
+    results = {}
+    for first in range(0, len(plan), batch_size):
+        batch = plan[first:first + batch_size]
+        replies = _send_batch(driver, batch)
+        if replies is None:
+            for item, _ in batch:
+                results[item] = read_raw(driver, *item)
+            continue
+        for (item, _), (general_status, data) in zip(batch, replies):
+            results[item] = data if general_status == 0 and data else None
+    return results
+
+
+def present_classes(driver: CIPDriver, classes: Iterable[int],
+                    batch_size: int = BATCH_SIZE) -> Set[int]:
+    """Classes worth scanning, found with one probe of class attribute 1.
+
+    The probe addresses instance 0 (the class itself), so a "path
+    destination unknown" reply can only mean the class is missing; a
+    class with no instance 1 still answers. Any other status keeps the
+    class, as do classes in a packet the device rejects, since that
+    says nothing about the class itself.
+    """
+    present = set()
+    plan = build_plan(probes(classes, (0,), (1,)))
+    for first in range(0, len(plan), batch_size):
+        batch = plan[first:first + batch_size]
+        replies = _send_batch(driver, batch)
+        for n, (item, _) in enumerate(batch):
+            if replies is None or replies[n][0] != PATH_DESTINATION_UNKNOWN:
+                present.add(item[0])
+    return present
+
+
+def get_all_attributes(driver: CIPDriver, class_id: int, instance: int,
+                       max_attr: int = 20,
+                       batch_size: int = BATCH_SIZE) -> Dict[int, AttrData]:
+    """Try to read all attributes for a class/instance.
+
+    Returns:
+        Dict mapping each attribute that answered to its raw data
+    """
+    items = probes((class_id,), (instance,), range(1, max_attr + 1))
+    replies = scan(driver, build_plan(items), batch_size)
+    return {item[2]: replies[item] for item in items if replies[item]}
+
+
+def scan_class(replies: Dict[Probe, Optional[AttrData]], class_id: int,
+               instances: Iterable[int],
+               attrs: Sequence[int]) -> Dict[int, List[Tuple[int, AttrData]]]:
+    """Pick one class's answers out of a scan.
+
+    Returns:
+        Dict mapping each instance that answered to its (attr, data) list
+    """
+    found = {}
+    get = replies.get
+    for instance in instances:
+        for attr in attrs:
+            data = get((class_id, instance, attr))
+            if data:
+                found.setdefault(instance, []).append((attr, data))
+    return found
+
+
+def _decode_all(data: AttrData, real_digits: int = 6) -> List[str]:
+    """Every fixed-width interpretation of data that its length allows."""
+    results = []
+    if len(data) == 1:
+        results.append(f"BOOL={bool(data[0])}")
+        results.append(f"USINT={data[0]}")
+    if len(data) >= 2:
+        # One unpack per width; the narrower and signed views are
+        # derived from it rather than decoded again
+        udint = _U32(data)[0] if len(data) >= 4 else None
+        uint = udint & 0xFFFF if udint is not None else _U16(data)[0]
+        results.append(f"UINT={uint}")
+        results.append(f"INT={uint - 0x10000 if uint & 0x8000 else uint}")
+    if len(data) >= 4:
+        results.append(f"UDINT={udint}")
+        results.append(f"DINT={udint - 0x100000000 if udint & 0x80000000 else udint}")
+        results.append(f"REAL={_F32(data)[0]:.{real_digits}f}")
+    return results
+
+
+@lru_cache(maxsize=1024)
+def _describe(raw: bytes) -> str:
+    """decode_data's text for raw.
+
+    Cached, since a sweep sees the same few values (zeros, flags, small
+    counts) over and over.
+    """
+    return " | ".join([f"raw={raw.hex()}"] + _decode_all(raw))
+
+
+def decode_data(data: Optional[AttrData], label: str = "") -> str:
+    """Try to decode data as various types."""
+    if data is None:
+        return "None"
+    return _describe(bytes(data))
+
+
+def format_found(found: Dict[int, List[Tuple[int, AttrData]]],
+                 label: str = "Instance {}") -> str:
+    """Render a scan_class result as one block of output text."""
+    lines = []
+    for instance, attrs in found.items():
+        lines.append(f"\n  {label.format(instance)}:\n")
+        lines.extend(f"    Attr {attr:2d}: {decode_data(data)}\n" for attr, data in attrs)
+    return "".join(lines)
+
+
+# Every probe of the deep scan, built once and encoded, so deep_scan()
+# only has to pack it into Multiple Service Packets
+DEEP_SCAN = build_plan(
+    probes(range(MOTOR_INPUT_BASE, MOTOR_INPUT_BASE + 4), (1,), range(1, 50))
+    + probes((0x64,), range(0, 5), range(1, 50))
+    + probes((0x65, 0x70), range(0, 5), range(1, 30))
+    + probes(range(0x71, 0x81), range(0, 3), range(1, 20))
+    + probes((0x0A,), range(1, 10), range(1, 20))
+    + probes(range(0xA0, 0xB1), range(0, 3), range(1, 15))
+)
+
+
+def object_scan(driver: CIPDriver, batch_size: int = BATCH_SIZE):
+    """Survey the identity object, known classes, motor inputs and assemblies."""
+    # 1. Identity Object (Class 0x01)
+    print("=" * 60)
+    print("IDENTITY OBJECT (Class 0x01, Instance 1)")
+    print("=" * 60)
+    for attr, (name, dtype) in IDENTITY_ATTRS.items():
+        val = read_attribute(driver, IDENTITY_CLASS, 1, attr, dtype)
+        if val is not None:
+            print(f"  Attr {attr} ({name}): {val}")
+
+    # 2. Scan for additional classes
+    print("\n" + "=" * 60)
+    print("SCANNING FOR AVAILABLE CLASSES")
+    print("=" * 60)
+
+    for class_id, name in CLASSES_TO_CHECK:
+        attrs = get_all_attributes(driver, class_id, 1, 20, batch_size)
+        if attrs:
+            print(f"\n  Class 0x{class_id:02X} ({name}) - {len(attrs)} attributes found:")
+            sys.stdout.write("".join(f"    Attr {attr}: {val.hex()}\n" for attr, val in attrs.items()))
+
+    # 3. Deep dive on Motor Input objects
+    print("\n" + "=" * 60)
+    print("MOTOR INPUT OBJECTS - EXTENDED SCAN")
+    print("=" * 60)
+
+    for axis in range(1, 5):
+        class_id = MOTOR_INPUT_BASE + (axis - 1)
+        print(f"\n  Motor {axis} Input (Class 0x{class_id:02X}):")
+
+        # Try more attributes than documented
+        lines = []
+        for attr, raw in get_all_attributes(driver, class_id, 1, 29, batch_size).items():
+            # Try to decode as different types
+            interp_str = " | ".join(_decode_all(raw, real_digits=4))
+            lines.append(f"    Attr {attr}: {raw.hex()} {interp_str}\n")
+        sys.stdout.write("".join(lines))
+
+    # 4. Check for analog inputs (current sensors, voltage, etc.)
+    print("\n" + "=" * 60)
+    print("ANALOG INPUT SCAN (Class 0x0A)")
+    print("=" * 60)
+
+    for instance in range(1, 10):
+        attrs = get_all_attributes(driver, ANALOG_INPUT_CLASS, instance, 10, batch_size)
+        if attrs:
+            print(f"\n  Instance {instance}:")
+            sys.stdout.write("".join(f"    Attr {attr}: {val.hex()}\n" for attr, val in attrs.items()))
+
+    # 5. Check Assembly objects for I/O data
+    print("\n" + "=" * 60)
+    print("ASSEMBLY OBJECTS (Class 0x04)")
+    print("=" * 60)
+
+    for instance in ASSEMBLY_INSTANCES:
+        attrs = get_all_attributes(driver, ASSEMBLY_CLASS, instance, 5, batch_size)
+        if attrs:
+            print(f"\n  Assembly Instance {instance}:")
+            sys.stdout.write("".join(f"    Attr {attr}: {val.hex()}\n" for attr, val in attrs.items()))
+
+
+def deep_scan(driver: CIPDriver, batch_size: int = BATCH_SIZE):
+    """Sweep motor, vendor and analog classes looking for voltage, current and power data."""
+    # Most of the swept class IDs do not exist; skip their probes
+    present = present_classes(driver, sorted({item[0] for item, _ in DEEP_SCAN}), batch_size)
+    replies = scan(driver, tuple(probe for probe in DEEP_SCAN if probe[0][0] in present),
+                   batch_size)
+
+    # Motor Input Objects - Deep scan
+    print("=" * 70)
+    print("MOTOR INPUT OBJECTS - FULL ATTRIBUTE SCAN")
+    print("=" * 70)
+
+    lines = []
+    for axis in range(1, 5):
+        class_id = MOTOR_INPUT_BASE + (axis - 1)
+        lines.append(f"\nMotor {axis} Input (Class 0x{class_id:02X}):\n")
+
+        for attr, data in scan_class(replies, class_id, (1,), range(1, 50)).get(1, ()):
+            lines.append(f"  Attr {attr:2d}: {decode_data(data)}\n")
+    sys.stdout.write("".join(lines))
+
+    # ClearLink System Object (0x64) - might have voltage
+    print("\n" + "=" * 70)
+    print("CLEARLINK SYSTEM OBJECT (Class 0x64) - DEEP SCAN")
+    print("=" * 70)
+
+    sys.stdout.write(format_found(scan_class(replies, 0x64, range(0, 5), range(1, 50))))
+
+    # ClearLink I/O Object (0x65)
+    print("\n" + "=" * 70)
+    print("CLEARLINK I/O OBJECT (Class 0x65)")
+    print("=" * 70)
+
+    sys.stdout.write(format_found(scan_class(replies, 0x65, range(0, 5), range(1, 30))))
+
+    # Unknown Class 0x70 - might be power/status
+    print("\n" + "=" * 70)
+    print("UNKNOWN CLASS 0x70 - POSSIBLE POWER/STATUS")
+    print("=" * 70)
+
+    sys.stdout.write(format_found(scan_class(replies, 0x70, range(0, 5), range(1, 30))))
+
+    # Check higher class IDs that might have power data
+    print("\n" + "=" * 70)
+    print("SCANNING HIGHER CLASS IDS (0x71-0x80)")
+    print("=" * 70)
+
+    for class_id in range(0x71, 0x81):
+        found = scan_class(replies, class_id, range(0, 3), range(1, 20))
+        sys.stdout.write(format_found(found, f"Class 0x{class_id:02X}, Instance {{}}"))
+
+    # Analog Input Class - check for voltage/current
+    print("\n" + "=" * 70)
+    print("ANALOG INPUT OBJECT (Class 0x0A) - ALL ATTRIBUTES")
+    print("=" * 70)
+
+    sys.stdout.write(format_found(scan_class(replies, 0x0A, range(1, 10), range(1, 20))))
+
+    # Check Vendor-specific classes (often 0x64+ or 0xA0+)
+    print("\n" + "=" * 70)
+    print("VENDOR SPECIFIC CLASSES (0xA0-0xB0)")
+    print("=" * 70)
+
+    for class_id in range(0xA0, 0xB1):
+        found = scan_class(replies, class_id, range(0, 3), range(1, 15))
+        sys.stdout.write(format_found(found, f"Class 0x{class_id:02X}, Instance {{}}"))
+
+
+def _positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def parse_args(description: str, args: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Command line options shared by the discovery entry points."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--ip', default=os.environ.get('CLEARLINK_IP', CLEARLINK_IP),
+                        help='ClearLink address (default: $CLEARLINK_IP or %(default)s)')
+    parser.add_argument('--runs', type=_positive_int, default=1,
+                        help='repeat the scan on the same connection and time each pass')
+    parser.add_argument('--batch', type=_positive_int, default=BATCH_SIZE,
+                        help='Get_Attribute_Single requests per Multiple Service Packet')
+    return parser.parse_args(args)
+
+
+def run_scans(driver: CIPDriver, scans: Sequence, runs: int = 1,
+              batch_size: int = BATCH_SIZE):
+    """Run scans back to back on one open driver, runs times over.
+
+    Repeated passes reuse the session and forward open, so their times
+    show the steady-state cost of a scan.
+    """
+    for n in range(runs):
+        start = time.monotonic()
+        for i, scan_fn in enumerate(scans):
+            if i:
+                print()
+            scan_fn(driver, batch_size)
+        if runs > 1:
+            print(f"\nRun {n + 1}/{runs}: {time.monotonic() - start:.3f} s")
+
+
+def main(args=None):
+    """Run the object survey and the deep scan on one connection."""
+    args = parse_args("Discover the objects and attributes a ClearLink exposes.", args)
+    print(f"Connecting to ClearLink at {args.ip}...")
+
+    with CIPDriver(args.ip) as driver:
+        print("Connected!\n")
+
+        run_scans(driver, (object_scan, deep_scan), args.runs, args.batch)
+
+        print("\n" + "=" * 70)
+        print("DISCOVERY COMPLETE")
+        print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
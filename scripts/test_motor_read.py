@@ -3,11 +3,14 @@
 Test reading Motor Input objects from ClearLink.
 """
 
-import struct
-from pycomm3 import CIPDriver, Services
+from pycomm3 import CIPDriver, PycommError, Services
 
 CLEARLINK_IP = "192.168.20.240"
 
+# Service codes, resolved once rather than on every request
+GET_ATTRIBUTE_SINGLE = Services.get_attribute_single
+GET_ATTRIBUTES_ALL = Services.get_attributes_all
+
 # Motor Input Object class IDs
 MOTOR_INPUT_CLASSES = {
     1: 0x6A,
@@ -31,34 +34,33 @@ def read_attr(driver, class_id, instance, attr, dtype='raw'):
     """Read attribute with type conversion."""
     try:
         result = driver.generic_message(
-            service=Services.get_attribute_single,
+            service=GET_ATTRIBUTE_SINGLE,
             class_code=class_id,
             instance=instance,
             attribute=attr
         )
-        if result is None:
-            return None, f"No result"
-        if not result.value:
-            return None, f"Empty value, error={result.error}"
-
-        data = result.value
-        if dtype == 'BOOL':
-            return bool(data[0]), None
-        elif dtype == 'DINT' and len(data) >= 4:
-            return struct.unpack('<i', data[:4])[0], None
-        elif dtype == 'UDINT' and len(data) >= 4:
-            return struct.unpack('<I', data[:4])[0], None
-        else:
-            return data.hex(), None
-    except Exception as e:
+    except PycommError as e:
         return None, str(e)
+    if result is None:
+        return None, f"No result"
+    if not result.value:
+        return None, f"Empty value, error={result.error}"
+
+    data = result.value
+    if dtype == 'BOOL':
+        return bool(data[0]), None
+    elif dtype == 'DINT' and len(data) >= 4:
+        return int.from_bytes(data[:4], 'little', signed=True), None
+    elif dtype == 'UDINT' and len(data) >= 4:
+        return int.from_bytes(data[:4], 'little'), None
+    else:
+        return data.hex(), None
 
 
 def main():
     print(f"Connecting to ClearLink at {CLEARLINK_IP}...")
 
     with CIPDriver(CLEARLINK_IP) as driver:
-        driver.open()
         print("Connected!\n")
 
         # Try different instances (0 and 1)
@@ -86,7 +88,7 @@ def main():
             print(f"\nMotor {axis} (Class 0x{class_id:02X}):")
             try:
                 result = driver.generic_message(
-                    service=Services.get_attributes_all,
+                    service=GET_ATTRIBUTES_ALL,
                     class_code=class_id,
                     instance=1
                 )
@@ -94,7 +96,7 @@ def main():
                     print(f"  All attrs: {result.value.hex()}")
                 else:
                     print(f"  No data, error={result.error if result else 'None'}")
-            except Exception as e:
+            except PycommError as e:
                 print(f"  Error: {e}")
 
         # Check if motors need to be enabled first
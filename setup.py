@@ -28,6 +28,7 @@ setup(
     entry_points={
         'console_scripts': [
             'clearlink_node = clearlink_driver.clearlink_node:main',
+            'discover = clearlink_driver.discovery:main',
         ],
     },
 )
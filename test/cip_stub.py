@@ -0,0 +1,120 @@
+"""Stub CIPDriver shared by the unit tests.
+
+Stands in for a ClearLink on the other end of pycomm3, so the EIP and
+control layers can be exercised without hardware or pycomm3 installed.
+"""
+
+import struct
+
+from clearlink_driver.clearlink_eip import ClearLinkEIP
+
+
+GET = ClearLinkEIP.SVC_GET_ATTR_SINGLE
+SET = ClearLinkEIP.SVC_SET_ATTR_SINGLE
+INPUT = ClearLinkEIP.MOTOR_INPUT_CLASS
+
+# CIP general status codes the stub replies with
+EMBEDDED_SERVICE_ERROR = 0x1E
+ATTRIBUTE_NOT_SUPPORTED = 0x14
+ATTRIBUTE_NOT_SETTABLE = 0x0E
+
+
+class StubTag:
+    """Stands in for pycomm3.Tag, including its falsiness on error."""
+
+    def __init__(self, value, error=None):
+        self.value = value
+        self.error = error
+
+    def __bool__(self):
+        return self.value is not None and self.error is None
+
+
+class StubDriver:
+    """CIPDriver stand-in serving attributes from a dict.
+
+    Multiple Service Packets are answered the way a device does: one
+    embedded reply per request, with general status 0x1E on the packet
+    if any of them failed. With reject_msp set, every packet is refused
+    as a whole instead. Writes to the attributes in read_only are refused.
+    """
+
+    def __init__(self, attrs, reject_msp=False, read_only=()):
+        self.attrs = dict(attrs)
+        self.reject_msp = reject_msp
+        self.read_only = set(read_only)
+        # (service, class, instance, attribute) of every request sent,
+        # embedded ones included
+        self.requests = []
+        self.packets = []
+        self.singles = 0
+
+    def _serve(self, service, class_id, instance, attribute, data):
+        self.requests.append((service, class_id, instance, attribute))
+        key = (class_id, instance, attribute)
+        if service == SET:
+            if key in self.read_only:
+                return ATTRIBUTE_NOT_SETTABLE, b''
+            self.attrs[key] = bytes(data)
+            return 0, b''
+        if key not in self.attrs:
+            return ATTRIBUTE_NOT_SUPPORTED, b''
+        return 0, self.attrs[key]
+
+    def generic_message(self, service, class_code, instance, attribute=b'',
+                        request_data=b'', **kwargs):
+        if service == ClearLinkEIP.SVC_MULTIPLE_SERVICE:
+            self.packets.append(request_data)
+            if self.reject_msp:
+                return StubTag(None, error='Service not supported')
+            return self._multiple_service(request_data)
+        self.singles += 1
+        status, data = self._serve(service, class_code, instance, attribute or None,
+                                   request_data)
+        if status:
+            return StubTag(None, error=f'General status 0x{status:02X}')
+        return StubTag(data)
+
+    def _multiple_service(self, packet):
+        count = struct.unpack_from('<H', packet)[0]
+        offsets = list(struct.unpack_from(f'<{count}H', packet, 2)) + [len(packet)]
+        replies = []
+        for start, end in zip(offsets, offsets[1:]):
+            body = packet[start:end]
+            service, path = body[0], body[2:2 + 2 * body[1]]
+            # 8-bit logical segments: class, instance, attribute
+            status, data = self._serve(service, path[1], path[3], path[5],
+                                       body[2 + 2 * body[1]:])
+            replies.append(bytes((service | 0x80, 0, status, 0)) + data)
+        reply_offsets = []
+        offset = 2 + 2 * count
+        for reply in replies:
+            reply_offsets.append(offset)
+            offset += len(reply)
+        value = struct.pack(f'<{count + 1}H', count, *reply_offsets) + b''.join(replies)
+        failed = any(reply[2] for reply in replies)
+        return StubTag(value, error='Embedded service error' if failed else None)
+
+
+def dint(value):
+    """Encode a DINT attribute value."""
+    return struct.pack('<i', value)
+
+
+def status_attrs(axes, status_reg=0):
+    """STATUS_ATTRS of idle axes: status register, shutdowns, position, velocity, torque."""
+    attrs = {}
+    for axis in axes:
+        for attribute, data in zip(ClearLinkEIP.STATUS_ATTRS,
+                                   (dint(status_reg), dint(0), dint(100 * axis),
+                                    dint(0), struct.pack('<f', 1.5))):
+            attrs[(INPUT, axis, attribute)] = data
+    return attrs
+
+
+def connected_eip(driver, num_axes=2):
+    """A ClearLinkEIP talking to driver, as if connect() had succeeded."""
+    eip = ClearLinkEIP('192.0.2.1', num_axes=num_axes)
+    eip._driver = driver
+    eip._connected = True
+    return eip
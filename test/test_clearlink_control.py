@@ -0,0 +1,145 @@
+"""Unit tests for the ClearLink control layer against a stub CIPDriver."""
+
+import threading
+
+from clearlink_driver.clearlink_control import ClearLinkControl
+from clearlink_driver.clearlink_eip import ClearLinkEIP, ClearLinkStatus
+
+from cip_stub import INPUT, StubDriver, dint, status_attrs
+
+
+def _connected_control(driver, num_axes=2, status_ttl=0.0):
+    control = ClearLinkControl('192.0.2.1', num_axes=num_axes, status_ttl=status_ttl)
+    control._eip._driver = driver
+    control._eip._connected = True
+    control.refresh_connection_state()
+    return control
+
+
+def test_unchanged_drive_command_sends_nothing():
+    driver = StubDriver(status_attrs((1, 2)))
+    control = _connected_control(driver)
+
+    assert control.drive_velocity([100, 200])
+    assert driver.requests
+    assert control._last_velocities_tuple == (100, 200)
+
+    driver.requests.clear()
+    assert control.drive_velocity([100, 200])
+    assert driver.requests == []
+
+    # Only the changed axis is commanded
+    assert control.drive_velocity([100, 300])
+    assert {request[2] for request in driver.requests} == {2}
+    assert control._last_velocities_tuple == (100, 300)
+
+
+def test_stop_resets_the_velocity_cache():
+    driver = StubDriver(status_attrs((1, 2)))
+    control = _connected_control(driver)
+
+    assert control.drive_velocity([100, 200])
+    assert control.stop()
+    assert control._last_velocities_tuple == (0, 0)
+
+    # The same command after a stop is sent again
+    driver.requests.clear()
+    assert control.drive_velocity([100, 200])
+    assert {request[2] for request in driver.requests} == {1, 2}
+
+
+def test_read_status_shares_reads_within_the_ttl():
+    driver = StubDriver(status_attrs((1, 2)))
+    control = _connected_control(driver, status_ttl=60.0)
+
+    first = control.read_status()
+    packets = len(driver.packets)
+    assert control.read_status() is first
+    assert len(driver.packets) == packets
+    assert first.axes[1].position == 200
+
+
+def test_read_status_reads_fresh_without_a_ttl():
+    driver = StubDriver(status_attrs((1, 2)))
+    control = _connected_control(driver, status_ttl=0.0)
+
+    control.read_status()
+    packets = len(driver.packets)
+    control.read_status()
+    assert len(driver.packets) > packets
+
+
+def test_read_status_serves_the_poller_snapshot():
+    driver = StubDriver(status_attrs((1, 2)))
+    control = _connected_control(driver)
+    snapshot = ClearLinkStatus(connected=True)
+    control._eip._latest = snapshot
+
+    assert control.read_status() is snapshot
+    assert driver.requests == []
+
+
+def test_read_diagnostics_fault_mask_sources():
+    # Axis 2 reports a blocking shutdown
+    attrs = status_attrs((1, 2))
+    attrs[(INPUT, 2, ClearLinkEIP.ATTR_IN_SHUTDOWN_REG)] = dint(0x02)
+    driver = StubDriver(attrs)
+
+    # No snapshot and no recent status: only the shutdown registers are read
+    control = _connected_control(driver, status_ttl=60.0)
+    assert control.read_diagnostics().axis_faults_mask == 0b10
+    assert {request[3] for request in driver.requests} == {ClearLinkEIP.ATTR_IN_SHUTDOWN_REG}
+
+    # A status read within the TTL already carries the mask
+    control.read_status()
+    driver.requests.clear()
+    assert control.read_diagnostics().axis_faults_mask == 0b10
+    assert driver.requests == []
+
+    # The poller's snapshot wins, without any I/O
+    control._eip._latest = ClearLinkStatus(connected=True, fault_mask=0b01)
+    assert control.read_diagnostics().axis_faults_mask == 0b01
+    assert driver.requests == []
+
+
+def test_read_diagnostics_counts_commands_and_errors():
+    driver = StubDriver(status_attrs((1, 2)))
+    control = _connected_control(driver)
+
+    assert control.drive_velocity([100, 200])
+    diag = control.read_diagnostics()
+    assert (diag.total_commands_sent, diag.total_errors) == (2, 0)
+    # Reading the counts does not change them
+    diag = control.read_diagnostics()
+    assert (diag.total_commands_sent, diag.total_errors) == (2, 0)
+
+
+def test_connection_loss_is_mirrored_after_reads():
+    class DeadDriver(StubDriver):
+        def generic_message(self, *args, **kwargs):
+            raise OSError('connection reset')
+
+    control = _connected_control(DeadDriver({}))
+    assert control.connected
+
+    for _ in range(control._eip._max_read_failures):
+        control.read_status()
+    assert not control.connected
+    assert control.connection_error.startswith('Read failures')
+
+
+def test_clear_faults_waits_for_an_in_flight_drive():
+    control = _connected_control(StubDriver(status_attrs((1, 2))))
+    done = threading.Event()
+
+    def clear():
+        control.clear_faults([1])
+        done.set()
+
+    # Holding _cmd_in_flight stands in for a drive_velocity mid-sequence
+    with control._cmd_in_flight:
+        clearer = threading.Thread(target=clear)
+        clearer.start()
+        assert not done.wait(0.05)
+    assert done.wait(2.0)
+    clearer.join(2.0)
@@ -0,0 +1,213 @@
+"""Unit tests for the ClearLink EtherNet/IP layer against a stub CIPDriver."""
+
+import struct
+import threading
+import time
+
+from clearlink_driver.clearlink_eip import ClearLinkEIP, _RWLock, _decode_status_rows
+
+from cip_stub import GET, INPUT, SET, StubDriver, connected_eip, dint, status_attrs
+
+
+def test_rwlock_writer_waits_out_readers_and_blocks_new_ones():
+    lock = _RWLock()
+    order = []
+    first_reader = lock.read_locked()
+    first_reader.__enter__()
+
+    def writer():
+        with lock.write_locked():
+            order.append('writer')
+
+    def late_reader():
+        with lock.read_locked():
+            order.append('reader')
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    deadline = time.monotonic() + 2.0
+    while not lock._writers_waiting and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert lock._writers_waiting == 1
+
+    reader_thread = threading.Thread(target=late_reader)
+    reader_thread.start()
+    time.sleep(0.05)
+    # The writer is held off by the first reader, the late reader by the writer
+    assert order == []
+
+    first_reader.__exit__(None, None, None)
+    writer_thread.join(2.0)
+    reader_thread.join(2.0)
+    assert order == ['writer', 'reader']
+
+
+def test_multi_service_splits_packets_to_fit_connection():
+    attrs = {(INPUT, 1, attribute): dint(attribute) for attribute in range(1, 21)}
+    driver = StubDriver(attrs)
+    eip = connected_eip(driver)
+    eip._max_msp_size = 64
+
+    replies = eip.multi_service([(GET, INPUT, 1, attribute, b'')
+                                 for attribute in range(1, 21)])
+
+    assert [bytes(reply) for reply in replies] == [dint(n) for n in range(1, 21)]
+    assert len(driver.packets) > 1
+    assert all(len(packet) <= 64 for packet in driver.packets)
+    assert driver.singles == 0
+
+
+def test_multi_service_keeps_good_replies_of_a_partly_failed_packet():
+    driver = StubDriver({(INPUT, 1, 1): dint(7), (INPUT, 1, 3): dint(9)})
+    eip = connected_eip(driver)
+
+    replies = eip.multi_service([(GET, INPUT, 1, attribute, b'') for attribute in (1, 2, 3)])
+
+    # General status 0x1E only flags the failed request; nothing is resent
+    assert bytes(replies[0]) == dint(7)
+    assert replies[1] is None
+    assert bytes(replies[2]) == dint(9)
+    assert len(driver.packets) == 1
+    assert driver.singles == 0
+
+
+def test_multi_service_falls_back_to_single_requests_when_rejected():
+    driver = StubDriver({(INPUT, 1, 1): dint(7), (INPUT, 1, 3): dint(9)},
+                        reject_msp=True)
+    eip = connected_eip(driver)
+
+    replies = eip.multi_service([(GET, INPUT, 1, attribute, b'') for attribute in (1, 2, 3)])
+
+    assert replies == [dint(7), None, dint(9)]
+    assert len(driver.packets) == 1
+    assert driver.singles == 3
+
+
+def test_decode_status_rows_with_mis_sized_replies():
+    good = [dint(1), dint(2), dint(3), dint(4), struct.pack('<f', 1.5)]
+    # Three bytes then five: the right total length, but misaligned
+    shifted = [b'\x01\x00\x00', b'\x02\x00\x00\x00\x00'] + good[2:]
+    missing = [None] + good[1:]
+    long_reply = [dint(1) + b'\xff\xff'] + good[1:]
+
+    assert _decode_status_rows([good, good]) == [(1, 2, 3, 4, 1.5)] * 2
+    assert _decode_status_rows([shifted, good]) == [(None, 2, 3, 4, 1.5),
+                                                    (1, 2, 3, 4, 1.5)]
+    assert _decode_status_rows([missing, good]) == [(None, 2, 3, 4, 1.5),
+                                                    (1, 2, 3, 4, 1.5)]
+    assert _decode_status_rows([long_reply]) == [(1, 2, 3, 4, 1.5)]
+
+
+def test_idle_probe_cache_is_dropped_by_a_write():
+    driver = StubDriver(status_attrs((1, 2)))
+    eip = connected_eip(driver)
+    full_read = len(ClearLinkEIP.STATUS_ATTRS)
+
+    def reads_per_axis():
+        driver.requests.clear()
+        eip.get_all_status_fresh()
+        return [sum(1 for request in driver.requests if request[2] == axis)
+                for axis in (1, 2)]
+
+    assert reads_per_axis() == [full_read, full_read]
+    # Both axes are idle, so only their status registers are probed
+    assert reads_per_axis() == [1, 1]
+
+    eip.multi_service([(SET, ClearLinkEIP.MOTOR_OUTPUT_CLASS, 1,
+                        ClearLinkEIP.ATTR_OUT_OUTPUT_REG, dint(0))])
+    assert reads_per_axis() == [full_read, 1]
+
+    assert reads_per_axis() == [1, 1]
+    assert eip._write_raw(ClearLinkEIP.MOTOR_OUTPUT_CLASS, 2,
+                          ClearLinkEIP.ATTR_OUT_OUTPUT_REG, dint(0))
+    assert reads_per_axis() == [1, full_read]
+
+    assert reads_per_axis() == [1, 1]
+    assert eip._write_output_reg(1, 0x40)
+    assert reads_per_axis() == [full_read, 1]
+
+
+def test_write_during_a_status_read_drops_that_read():
+    class SlowDriver(StubDriver):
+        """Holds the first packet until released, as a slow reply would."""
+
+        def __init__(self, attrs):
+            super().__init__(attrs)
+            self.in_packet = threading.Event()
+            self.release = threading.Event()
+
+        def generic_message(self, service, *args, **kwargs):
+            if service == ClearLinkEIP.SVC_MULTIPLE_SERVICE and not self.release.is_set():
+                self.in_packet.set()
+                self.release.wait(2.0)
+            return super().generic_message(service, *args, **kwargs)
+
+    driver = SlowDriver(status_attrs((1, 2)))
+    eip = connected_eip(driver)
+
+    reader = threading.Thread(target=eip.get_all_status_fresh)
+    reader.start()
+    assert driver.in_packet.wait(2.0)
+    writer = threading.Thread(target=eip._write_output_reg, args=(1, 0x40))
+    writer.start()
+    time.sleep(0.05)
+    driver.release.set()
+    reader.join(2.0)
+    writer.join(2.0)
+
+    # The read finished before the write went out, so axis 1's replies
+    # predate it and must not be reused by the idle probe
+    driver.requests.clear()
+    eip.get_all_status_fresh()
+    axis1_reads = sum(1 for request in driver.requests if request[2] == 1)
+    assert axis1_reads == len(ClearLinkEIP.STATUS_ATTRS)
+
+
+def test_refused_write_is_reported_and_not_cached():
+    output_reg = (ClearLinkEIP.MOTOR_OUTPUT_CLASS, 1, ClearLinkEIP.ATTR_OUT_OUTPUT_REG)
+    driver = StubDriver({}, read_only={output_reg})
+    eip = connected_eip(driver)
+
+    assert not eip._write_output_reg(1, 5)
+    # Nothing was recorded as written, so the next attempt goes out again
+    assert not eip._write_output_reg(1, 5)
+    assert driver.singles == 2
+
+    driver.read_only.clear()
+    assert eip._write_output_reg(1, 5)
+    assert eip._write_output_reg(1, 5)
+    assert driver.singles == 3
+
+
+def test_multi_service_falls_back_on_a_malformed_reply():
+    class ManglingDriver(StubDriver):
+        """Corrupts every Multiple Service reply with mangle."""
+
+        def __init__(self, attrs, mangle):
+            super().__init__(attrs)
+            self.mangle = mangle
+
+        def _multiple_service(self, packet):
+            tag = super()._multiple_service(packet)
+            tag.value = self.mangle(tag.value)
+            return tag
+
+    manglers = [
+        # Cut off inside the last embedded reply's header
+        lambda value: value[:-6],
+        # Service count that doesn't match the request
+        lambda value: struct.pack('<H', 5) + value[2:],
+        # Second offset past the end of the reply
+        lambda value: value[:4] + struct.pack('<H', 0xFFFF) + value[6:],
+        # Offset table only
+        lambda value: value[:8],
+    ]
+    for mangle in manglers:
+        driver = ManglingDriver({(INPUT, 1, 1): dint(7), (INPUT, 1, 3): dint(9)}, mangle)
+        eip = connected_eip(driver)
+
+        replies = eip.multi_service([(GET, INPUT, 1, attribute, b'')
+                                     for attribute in (1, 2, 3)])
+
+        assert replies == [dint(7), None, dint(9)]
+        assert driver.singles == 3